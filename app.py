@@ -2,36 +2,73 @@
 from __future__ import annotations
 
 import io
-import json
+import mmap
+import os
+import re
 import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stdout
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+import orjson
 from flask import Flask, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
 
 from cache_manager import CacheManager
 from pipeline.content_index import ContentIndex, ContentRecord
 from config import DATA_DIR, PROMPTS_DIR, USER_SETTINGS_FILE, get_user_settings
-import yaml
-from summarizer import Summarizer, SummarizationError
-from manage import run_refresh
 from youtube_transcript import extract_video_id, get_youtube_transcript
 from pipeline.readinglist_parser import ReadingListParser
 
+# summarizer (openai), manage (ingestors) and yaml are imported inside the routes that need them
+# to keep cold start fast.
+if TYPE_CHECKING:
+    from summarizer import Summarizer
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Encode API payloads with orjson instead of the stdlib ``json`` module."""
+
+    compact = True
+    sort_keys = False
+
+    def dumps(self, obj: object, **kwargs: object) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: object) -> object:
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = "reading_portal_secret"  # Replace for production
 
 cache = CacheManager()
+# Status entries are replaced whole, never mutated, so pollers can read them without locking.
 summary_status: Dict[str, Dict[str, str]] = {}
-summary_status_lock = threading.Lock()
+_summaries_in_flight: Set[str] = set()
+_summaries_in_flight_lock = threading.Lock()
+_serialize_cache: Dict[Tuple[str, str], Dict[str, object]] = {}
+_serialize_cache_lock = threading.Lock()
+_summary_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="summary")
+# Serializes reloads and upsert/save on the shared index so a reload or another summary worker can't drop an update.
+_index_write_lock = threading.Lock()
+_summarizer: Optional[Summarizer] = None
+_summarizer_lock = threading.Lock()
+_reading_list_cache: Dict[str, object] = {}
+_reading_list_lock = threading.Lock()
 READING_LIST_PATH = Path(__file__).resolve().parent / "readinglist.md"
 TRANSCRIPT_METADATA_PATH = Path(__file__).resolve().parent / "transcript_metadata.json"
 USER_TAGS_PATH = DATA_DIR / "user_tags.json"
 PROMPT_OVERRIDES_PATH = DATA_DIR / "prompt_overrides.json"
+PROMPT_FILE = PROMPTS_DIR / "summaries.yaml"
+ISO_DATE_PREFIX = re.compile(r"\d{4}-\d{2}-\d{2}")
 
 SECTION_CONFIG = {
     "youtube_video": {"header": "# Youtube Videos", "format": "{url}"},
@@ -40,6 +77,21 @@ SECTION_CONFIG = {
 }
 
 
+def _reading_list_snapshot() -> Tuple[List[str], Set[str]]:
+    """Return the reading list lines and URL set, re-reading the file only when it changed."""
+    stat = READING_LIST_PATH.stat()
+    key = (str(READING_LIST_PATH), stat.st_mtime_ns, stat.st_size)
+    if _reading_list_cache.get("key") != key:
+        text = READING_LIST_PATH.read_text(encoding="utf-8")
+        _reading_list_cache["key"] = key
+        _reading_list_cache["lines"] = text.splitlines()
+        _reading_list_cache["appendable"] = not text or text.endswith("\n")
+        _reading_list_cache["urls"] = {
+            match.group(0).rstrip(".,)") for match in ReadingListParser.URL_PATTERN.finditer(text)
+        }
+    return _reading_list_cache["lines"], _reading_list_cache["urls"]
+
+
 def add_url_to_reading_list(url: str, origin: str) -> None:
     config = SECTION_CONFIG.get(origin)
     if not config:
@@ -49,45 +101,53 @@ def add_url_to_reading_list(url: str, origin: str) -> None:
     if not url.startswith("http"):
         raise ValueError("URL must start with http or https")
 
-    lines = READING_LIST_PATH.read_text(encoding="utf-8").splitlines()
-    if any(url in line for line in lines):
-        raise ValueError("URL already exists in reading list")
+    with _reading_list_lock:
+        cached_lines, existing_urls = _reading_list_snapshot()
+        if url in existing_urls:
+            raise ValueError("URL already exists in reading list")
+        lines = list(cached_lines)
 
-    header = config["header"]
-    new_entry = config["format"].format(url=url)
+        header = config["header"]
+        new_entry = config["format"].format(url=url)
 
-    if header not in lines:
-        lines.append("")
-        lines.append(header)
-        lines.append("")
-        lines.append(new_entry)
-    else:
-        header_index = lines.index(header)
-        insert_index = header_index + 1
-        while insert_index < len(lines) and not lines[insert_index].startswith("# "):
-            insert_index += 1
-        if insert_index > header_index + 1 and lines[insert_index - 1].strip():
-            lines.insert(insert_index, new_entry)
+        appended: Optional[str] = None
+        if header not in lines:
+            lines.extend(["", header, "", new_entry])
+            appended = f"\n{header}\n\n{new_entry}\n"
         else:
+            header_index = lines.index(header)
+            insert_index = header_index + 1
+            while insert_index < len(lines) and not lines[insert_index].startswith("# "):
+                insert_index += 1
             lines.insert(insert_index, new_entry)
-
-    READING_LIST_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            if insert_index == len(lines) - 1:
+                appended = f"{new_entry}\n"
+
+        if appended is not None and _reading_list_cache.get("appendable"):
+            fd = os.open(READING_LIST_PATH, os.O_WRONLY | os.O_APPEND)
+            try:
+                os.write(fd, appended.encode("utf-8"))
+            finally:
+                os.close(fd)
+        else:
+            READING_LIST_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        stat = READING_LIST_PATH.stat()
+        _reading_list_cache["key"] = (str(READING_LIST_PATH), stat.st_mtime_ns, stat.st_size)
+        _reading_list_cache["lines"] = lines
+        _reading_list_cache["appendable"] = True
+        _reading_list_cache["urls"] = existing_urls | {url}
 
 
 def _load_json_file(path: Path) -> Dict[str, object]:
-    if not path.exists():
-        return {}
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return orjson.loads(path.read_bytes())
     except Exception:
         return {}
 
 
 def _save_json_file(path: Path, payload: Dict[str, object]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, ensure_ascii=False)
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
 
 def load_user_tags() -> Dict[str, List[str]]:
@@ -108,6 +168,24 @@ def save_prompt_overrides(overrides: Dict[str, Dict[str, object]]) -> None:
     _save_json_file(PROMPT_OVERRIDES_PATH, overrides)
 
 
+@lru_cache(maxsize=4)
+def _parse_default_prompts(mtime_ns: int) -> Dict[str, Dict[str, object]]:
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with PROMPT_FILE.open("r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=loader) or {}
+
+
+def load_default_prompts() -> Optional[Dict[str, Dict[str, object]]]:
+    try:
+        mtime_ns = PROMPT_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _parse_default_prompts(mtime_ns)
+
+
+@lru_cache(maxsize=4096)
 def _extract_domain(url: str) -> str:
     try:
         parsed = urlparse(url)
@@ -118,16 +196,19 @@ def _extract_domain(url: str) -> str:
 
 @lru_cache(maxsize=1)
 def load_transcript_metadata() -> Dict[str, Dict[str, object]]:
-    if TRANSCRIPT_METADATA_PATH.exists():
-        try:
-            with TRANSCRIPT_METADATA_PATH.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
-        except Exception:
-            return {}
-    return {}
+    try:
+        with TRANSCRIPT_METADATA_PATH.open("rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+    except Exception:
+        return {}
 
 
-def resolve_channel_url(record: ContentRecord, raw: Optional[Dict[str, object]] = None) -> Optional[str]:
+def resolve_channel_url(
+    record: ContentRecord,
+    raw: Optional[Dict[str, object]] = None,
+    metadata: Optional[Dict[str, Dict[str, object]]] = None,
+) -> Optional[str]:
     if record.source_type != "youtube_video":
         return None
 
@@ -137,7 +218,8 @@ def resolve_channel_url(record: ContentRecord, raw: Optional[Dict[str, object]]
     if channel_id:
         return f"https://www.youtube.com/channel/{channel_id}"
 
-    metadata = load_transcript_metadata()
+    if metadata is None:
+        metadata = load_transcript_metadata()
     video_id = record.content_id
     if video_id not in metadata:
         video_id = extract_video_id(record.original_url) or video_id
@@ -149,25 +231,49 @@ def resolve_channel_url(record: ContentRecord, raw: Optional[Dict[str, object]]
     return None
 
 
-def parse_date(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except ValueError:
-        return None
-
-
-def serialize_record(record: ContentRecord) -> Dict[str, object]:
-    summary = cache.load_summary(record.content_id)
+def invalidate_serialized(content_id: Optional[str] = None) -> None:
+    with _serialize_cache_lock:
+        if content_id is None:
+            _serialize_cache.clear()
+            return
+        for key in [key for key in _serialize_cache if key[0] == content_id]:
+            del _serialize_cache[key]
+
+
+def serialize_record(
+    record: ContentRecord,
+    user_tags_map: Optional[Dict[str, List[str]]] = None,
+    transcript_metadata: Optional[Dict[str, Dict[str, object]]] = None,
+    *,
+    summaries: Optional[Dict[str, Dict[str, object]]] = None,
+    raw_maps: Optional[Dict[str, Dict[str, Dict[str, object]]]] = None,
+) -> Dict[str, object]:
+    cache_key = (record.content_id, record.last_updated or "")
+    with _serialize_cache_lock:
+        cached = _serialize_cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+
+    if summaries is None:
+        summary = cache.load_summary(record.content_id)
+    else:
+        summary = summaries.get(record.content_id)
     summary_text = summary.get("summary") if summary else None
 
-    raw_data = cache.load_raw("youtube" if record.source_type == "youtube_video" else "blogs", record.content_id)
-    channel_url = resolve_channel_url(record, raw_data)
+    raw_source = "youtube" if record.source_type == "youtube_video" else "blogs"
+    if raw_maps is None:
+        raw_data = cache.load_raw(raw_source, record.content_id)
+    else:
+        raw_data = raw_maps.get(raw_source, {}).get(record.content_id)
+    channel_url = resolve_channel_url(record, raw_data, transcript_metadata)
 
     effective_published_at = record.published_at or (raw_data.get("published_at") if raw_data else None)
-    published_at_dt = parse_date(effective_published_at)
-    published_sort_key = published_at_dt or datetime.min
+    # ISO-8601 strings sort lexicographically, so the stored value doubles as the sort key.
+    iso_published_at = (
+        effective_published_at
+        if isinstance(effective_published_at, str) and ISO_DATE_PREFIX.match(effective_published_at)
+        else None
+    )
 
     transcript_available = True
     transcript_error = None
@@ -178,12 +284,14 @@ def serialize_record(record: ContentRecord) -> Dict[str, object]:
         else:
             transcript_available = False
 
-    user_tags = load_user_tags().get(record.content_id, [])
+    if user_tags_map is None:
+        user_tags_map = load_user_tags()
+    user_tags = user_tags_map.get(record.content_id, [])
     tags = list(dict.fromkeys([*(record.tags or []), *user_tags]))
     site_key = _extract_domain(record.original_url) if record.source_type == "blog_article" else None
     site_name = site_key
 
-    return {
+    data = {
         "content_id": record.content_id,
         "source_type": record.source_type,
         "origin": record.origin or record.source_type,
@@ -192,7 +300,7 @@ def serialize_record(record: ContentRecord) -> Dict[str, object]:
         "original_url": record.original_url,
         "channel_url": channel_url,
         "published_at": effective_published_at,
-        "published_display": published_at_dt.strftime("%Y-%m-%d") if published_at_dt else "Unknown",
+        "published_display": iso_published_at[:10] if iso_published_at else "Unknown",
         "categories": record.categories,
         "tags": tags,
         "site_key": site_key,
@@ -202,17 +310,63 @@ def serialize_record(record: ContentRecord) -> Dict[str, object]:
         "raw_path": record.raw_path,
         "summary_path": record.summary_path,
         "last_updated": record.last_updated,
-        "published_sort_key": published_sort_key.isoformat(),
+        "published_sort_key": iso_published_at or "",
         "transcript_available": transcript_available,
         "transcript_error": transcript_error,
     }
+    with _serialize_cache_lock:
+        _serialize_cache[cache_key] = data
+    return dict(data)
+
+
+def get_summarizer() -> Summarizer:
+    global _summarizer
+    from summarizer import Summarizer
+
+    with _summarizer_lock:
+        if _summarizer is None:
+            _summarizer = Summarizer(cache)
+        return _summarizer
+
+
+def reset_summarizer() -> None:
+    global _summarizer
+    with _summarizer_lock:
+        _summarizer = None
+
+
+def serialize_records(records: Iterable[ContentRecord]) -> List[Dict[str, object]]:
+    records = list(records)
+    user_tags_map = load_user_tags()
+    transcript_metadata = load_transcript_metadata()
+    with _serialize_cache_lock:
+        misses = sum(1 for record in records if (record.content_id, record.last_updated or "") not in _serialize_cache)
+
+    summaries = None
+    raw_maps = None
+    # Scanning the cache directories only pays off when most records need rebuilding.
+    if misses and misses * 2 >= len(records):
+        summaries = cache.load_all_summaries()
+        raw_maps = {"youtube": cache.load_all_raw("youtube"), "blogs": cache.load_all_raw("blogs")}
+
+    return [
+        serialize_record(record, user_tags_map, transcript_metadata, summaries=summaries, raw_maps=raw_maps)
+        for record in records
+    ]
 
 
 @lru_cache(maxsize=1)
-def load_index() -> ContentIndex:
+def _shared_index() -> ContentIndex:
     return ContentIndex()
 
 
+def load_index() -> ContentIndex:
+    index = _shared_index()
+    with _index_write_lock:
+        index.reload_if_modified()
+    return index
+
+
 @app.route("/")
 def home() -> str:
     return render_template("index.html")
@@ -221,43 +375,62 @@ def home() -> str:
 @app.route("/api/items")
 def api_items() -> object:
     category_filter = request.args.get("category")
-    index = ContentIndex()
-    items = [serialize_record(record) for record in index.all()]
+    index = load_index()
+    items = serialize_records(index.all())
 
     if category_filter:
         items = [item for item in items if category_filter in item["categories"]]
 
     items.sort(key=lambda item: item["published_sort_key"], reverse=True)
 
-    grouped_categories: Dict[str, List[Dict[str, object]]] = {}
-    grouped_origin: Dict[str, List[Dict[str, object]]] = {}
+    grouped_categories: Dict[str, List[str]] = {}
+    grouped_origin: Dict[str, List[str]] = {}
     for item in items:
+        content_id = item["content_id"]
         for category in item["categories"]:
-            grouped_categories.setdefault(category, []).append(item)
+            grouped_categories.setdefault(category, []).append(content_id)
         origin = item.get("origin") or item["source_type"]
-        grouped_origin.setdefault(origin, []).append(item)
+        grouped_origin.setdefault(origin, []).append(content_id)
 
     stats = {
         "total_items": len(items),
-        "by_source": {},
+        "by_source": Counter(item["source_type"] for item in items),
         "by_origin": {key: len(value) for key, value in grouped_origin.items()},
         "latest_published_at": items[0]["published_display"] if items else None,
     }
-    for item in items:
-        stats["by_source"].setdefault(item["source_type"], 0)
-        stats["by_source"][item["source_type"]] += 1
 
-    return jsonify({"items": items, "grouped": grouped_categories, "grouped_origin": grouped_origin, "stats": stats})
+    def generate() -> Iterator[bytes]:
+        # Encode one item at a time so the full payload is never held as a single string.
+        yield b'{"items":['
+        for position, item in enumerate(items):
+            if position:
+                yield b","
+            yield orjson.dumps(item, default=str)
+        yield b'],"grouped":'
+        yield orjson.dumps(grouped_categories)
+        yield b',"grouped_origin":'
+        yield orjson.dumps(grouped_origin)
+        yield b',"stats":'
+        yield orjson.dumps(stats)
+        yield b"}"
+
+    return app.response_class(generate(), mimetype="application/json")
 
 
 @app.route("/api/refresh", methods=["POST"])
 def api_refresh() -> object:
+    from manage import run_refresh
+
     log_stream = io.StringIO()
     try:
         with redirect_stdout(log_stream):
             run_refresh(READING_LIST_PATH, skip_summaries=True)
     except Exception as exc:
         return jsonify({"status": "error", "message": f"Refresh failed: {exc}"}), 500
+    finally:
+        with _index_write_lock:
+            _shared_index().reload()
+        invalidate_serialized()
     return jsonify({"status": "ok", "logs": log_stream.getvalue()})
 
 
@@ -269,7 +442,7 @@ def api_channels() -> object:
     except Exception as exc:
         return jsonify({"status": "error", "message": str(exc)}), 500
 
-    index = ContentIndex()
+    index = load_index()
     counts: Dict[str, int] = {}
     for record in index.all():
         if record.origin != "youtube_channel":
@@ -312,7 +485,7 @@ def api_blogs() -> object:
     except Exception as exc:
         return jsonify({"status": "error", "message": str(exc)}), 500
 
-    index = ContentIndex()
+    index = load_index()
     counts: Dict[str, int] = {}
     for record in index.all():
         if record.origin != "blog":
@@ -320,17 +493,12 @@ def api_blogs() -> object:
         site_key = _extract_domain(record.original_url)
         counts[site_key] = counts.get(site_key, 0) + 1
 
-    def _display_name(entry: ReadingListEntry) -> str:
-        if entry.title:
-            return entry.title
-        return _extract_domain(entry.url)
-
     blogs = []
     for entry in entries:
         site_key = _extract_domain(entry.url)
         blogs.append(
             {
-                "name": _display_name(entry),
+                "name": entry.title or site_key,
                 "url": entry.url,
                 "site_key": site_key,
                 "category": entry.category,
@@ -344,7 +512,7 @@ def api_blogs() -> object:
 
 @app.route("/api/items/<content_id>")
 def api_item_detail(content_id: str) -> object:
-    index = ContentIndex()
+    index = load_index()
     record = index.get(content_id)
     if not record:
         return jsonify({"error": "Content not found"}), 404
@@ -362,7 +530,7 @@ def api_item_detail(content_id: str) -> object:
 
 @app.route("/api/items/<content_id>/transcripts", methods=["POST"])
 def api_fetch_transcript(content_id: str) -> object:
-    index = ContentIndex()
+    index = load_index()
     record = index.get(content_id)
     if not record:
         return jsonify({"status": "error", "message": "Content not found"}), 404
@@ -383,6 +551,7 @@ def api_fetch_transcript(content_id: str) -> object:
         raw["transcript_available"] = False
         raw["transcript_error"] = message
         cache.save_raw("youtube", content_id, raw)
+        invalidate_serialized(content_id)
         return jsonify({"status": "error", "message": message}), 400
 
     transcript = result.get("transcript") or ""
@@ -396,6 +565,7 @@ def api_fetch_transcript(content_id: str) -> object:
         }
     )
     cache.save_raw("youtube", content_id, raw)
+    invalidate_serialized(content_id)
 
     video_id = extract_video_id(video_url) or content_id
     transcripts_dir = Path(__file__).resolve().parent / "transcripts"
@@ -410,31 +580,32 @@ def api_fetch_transcript(content_id: str) -> object:
 
 @app.route("/api/items/<content_id>/summaries", methods=["POST"])
 def api_regenerate_summary(content_id: str) -> object:
+    from summarizer import SummarizationError
+
     try:
-        summarizer = Summarizer(cache)
+        summarizer = get_summarizer()
     except SummarizationError as exc:
         return jsonify({"status": "error", "message": str(exc)}), 400
 
-    index = ContentIndex()
+    index = load_index()
     record = index.get(content_id)
     if not record:
         return jsonify({"status": "error", "message": "Content not found"}), 404
 
-    with summary_status_lock:
-        status = summary_status.get(content_id)
-        if status and status.get("status") == "running":
-            return jsonify({"status": "running"})
-        summary_status[content_id] = {"status": "queued", "progress": "0"}
+    with _summaries_in_flight_lock:
+        if content_id in _summaries_in_flight:
+            status = summary_status.get(content_id) or {}
+            return jsonify({"status": status.get("status", "queued")})
+        _summaries_in_flight.add(content_id)
+    summary_status[content_id] = {"status": "queued", "progress": "0"}
 
-    thread = threading.Thread(target=_run_summary, args=(record, summarizer), daemon=True)
-    thread.start()
+    _summary_executor.submit(_run_summary, record, summarizer)
     return jsonify({"status": "queued"})
 
 
 @app.route("/api/items/<content_id>/status")
 def api_summary_status(content_id: str) -> object:
-    with summary_status_lock:
-        status = summary_status.get(content_id)
+    status = summary_status.get(content_id)
     if not status:
         summary = cache.load_summary(content_id)
         if summary:
@@ -445,32 +616,26 @@ def api_summary_status(content_id: str) -> object:
 
 @app.route("/api/stats")
 def api_stats() -> object:
-    index = ContentIndex()
-    items = [serialize_record(record) for record in index.all()]
-    items.sort(key=lambda item: item["published_sort_key"], reverse=True)
+    index = load_index()
+    items = serialize_records(index.all())
 
-    by_category: Dict[str, int] = {}
-    for item in items:
-        for category in item["categories"]:
-            by_category[category] = by_category.get(category, 0) + 1
-
-    by_origin: Dict[str, int] = {}
-    for item in items:
-        origin = item.get("origin") or item["source_type"]
-        by_origin[origin] = by_origin.get(origin, 0) + 1
+    by_category = Counter(category for item in items for category in item["categories"])
+    by_origin = Counter(item.get("origin") or item["source_type"] for item in items)
 
     return jsonify(
         {
             "total_items": len(items),
             "categories": by_category,
             "origins": by_origin,
-            "latest": items[0] if items else None,
+            "latest": max(items, key=lambda item: item["published_sort_key"]) if items else None,
         }
     )
 
 
 @app.route("/api/items/add", methods=["POST"])
 def api_add_item() -> object:
+    from manage import run_refresh
+
     data = request.get_json(silent=True) or {}
     url = (data.get("url") or "").strip()
     origin = data.get("origin")
@@ -491,9 +656,13 @@ def api_add_item() -> object:
             run_refresh(READING_LIST_PATH, skip_summaries=True)
     except Exception as exc:
         return jsonify({"status": "error", "message": f"Refresh failed: {exc}"}), 500
+    finally:
+        with _index_write_lock:
+            _shared_index().reload()
+        invalidate_serialized()
 
     logs = log_stream.getvalue()
-    index = ContentIndex()
+    index = load_index()
     record = next((item for item in index.all() if item.original_url == url), None)
     if not record:
         video_id = extract_video_id(url)
@@ -524,6 +693,7 @@ def api_item_tags(content_id: str) -> object:
     user_tags = load_user_tags()
     user_tags[content_id] = cleaned
     save_user_tags(user_tags)
+    invalidate_serialized(content_id)
     return jsonify({"status": "ok", "tags": cleaned})
 
 
@@ -555,28 +725,24 @@ def api_settings() -> object:
             settings.pop("openai_api_key", None)
 
     _save_json_file(USER_SETTINGS_FILE, settings)
+    reset_summarizer()
     return jsonify({"status": "ok"})
 
 
 @app.route("/api/prompts")
 def api_prompt_keys() -> object:
-    prompt_file = PROMPTS_DIR / "summaries.yaml"
-    if not prompt_file.exists():
+    default_prompts = load_default_prompts()
+    if default_prompts is None:
         return jsonify({"status": "error", "message": "Prompt file not found."}), 404
-    with prompt_file.open("r", encoding="utf-8") as handle:
-        default_prompts = yaml.safe_load(handle) or {}
     return jsonify({"status": "ok", "keys": list(default_prompts.keys())})
 
 
 @app.route("/api/prompts/<prompt_key>", methods=["GET", "POST"])
 def api_prompts(prompt_key: str) -> object:
-    prompt_file = PROMPTS_DIR / "summaries.yaml"
-    if not prompt_file.exists():
+    default_prompts = load_default_prompts()
+    if default_prompts is None:
         return jsonify({"status": "error", "message": "Prompt file not found."}), 404
 
-    with prompt_file.open("r", encoding="utf-8") as handle:
-        default_prompts = yaml.safe_load(handle) or {}
-
     if prompt_key not in default_prompts:
         return jsonify({"status": "error", "message": "Unknown prompt key."}), 404
 
@@ -605,36 +771,32 @@ def api_prompts(prompt_key: str) -> object:
         "user": user,
     }
     save_prompt_overrides(overrides)
+    reset_summarizer()
     return jsonify({"status": "ok", "override": overrides[prompt_key]})
 
 
 def _run_summary(record: ContentRecord, summarizer: Summarizer) -> None:
-    with summary_status_lock:
-        summary_status[record.content_id] = {"status": "running", "progress": "5"}
+    summary_status[record.content_id] = {"status": "running", "progress": "5"}
     try:
         result = summarizer.summarize(record, force=True)
-        index = ContentIndex()
-        updated = ContentRecord(
-            content_id=record.content_id,
-            source_type=record.source_type,
-            origin=record.origin,
-            original_url=record.original_url,
-            title=record.title,
+        updated = replace(
+            record,
             summary_path=str(result.summary_path),
-            published_at=record.published_at,
-            author=record.author,
-            categories=record.categories,
-            tags=record.tags,
-            raw_path=record.raw_path,
-            last_updated=datetime.utcnow().isoformat() + "Z",
+            last_updated=datetime.now(timezone.utc).isoformat(),
         )
-        index.upsert(updated)
-        index.save()
-        with summary_status_lock:
-            summary_status[record.content_id] = {"status": "complete", "progress": "100"}
+        index = _shared_index()
+        with _index_write_lock:
+            # Pick up writes from other processes (e.g. a refresh) before saving over them.
+            index.reload_if_modified()
+            index.upsert(updated)
+            index.save()
+        invalidate_serialized(record.content_id)
+        summary_status[record.content_id] = {"status": "complete", "progress": "100"}
     except Exception as exc:  # pragma: no cover - runtime path
-        with summary_status_lock:
-            summary_status[record.content_id] = {"status": "error", "message": str(exc)}
+        summary_status[record.content_id] = {"status": "error", "message": str(exc)}
+    finally:
+        with _summaries_in_flight_lock:
+            _summaries_in_flight.discard(record.content_id)
 
 
 if __name__ == "__main__":
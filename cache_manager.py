@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
+
+import orjson
 
 from config import RAW_CACHE_DIR, SUMMARY_CACHE_DIR
 
@@ -15,28 +17,32 @@ class CacheManager:
         self.summary_dir = summary_dir
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.summary_dir.mkdir(parents=True, exist_ok=True)
+        self._created_dirs: Set[Path] = {self.raw_dir, self.summary_dir}
 
     @staticmethod
     def sha256(text: str) -> str:
+        # Stored as content_hash in raw and summary caches; switching algorithms would
+        # invalidate every cached summary and trigger a full re-summarization.
         return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
     def raw_path(self, source_type: str, content_id: str) -> Path:
         return self.raw_dir / source_type / f"{content_id}.json"
 
     def load_raw(self, source_type: str, content_id: str) -> Optional[Dict[str, Any]]:
-        path = self.raw_path(source_type, content_id)
-        if not path.exists():
+        try:
+            data = self.raw_path(source_type, content_id).read_bytes()
+        except FileNotFoundError:
             return None
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return orjson.loads(data)
 
     def save_raw(self, source_type: str, content_id: str, payload: Dict[str, Any]) -> None:
         path = self.raw_path(source_type, content_id)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.parent not in self._created_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path.parent)
         payload = {**payload}
         payload.setdefault("cached_at", self._utc_now())
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2, ensure_ascii=False)
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS))
 
     def raw_is_current(self, source_type: str, content_id: str, content_hash: str) -> bool:
         cached = self.load_raw(source_type, content_id)
@@ -44,20 +50,46 @@ class CacheManager:
             return False
         return cached.get("content_hash") == content_hash
 
+    def load_http_validators(self, url: str) -> Dict[str, str]:
+        cached = self.load_raw("http", self.sha256(url)) or {}
+        return {key: cached[key] for key in ("etag", "last_modified") if cached.get(key)}
+
+    def save_http_validators(self, url: str, *, etag: Optional[str], last_modified: Optional[str]) -> None:
+        self.save_raw("http", self.sha256(url), {"url": url, "etag": etag, "last_modified": last_modified})
+
     def save_summary(self, content_id: str, summary: Dict[str, Any]) -> None:
         path = self.summary_dir / f"{content_id}.json"
-        path.parent.mkdir(parents=True, exist_ok=True)
         summary = {**summary}
         summary.setdefault("cached_at", self._utc_now())
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(summary, handle, indent=2, ensure_ascii=False)
+        path.write_bytes(orjson.dumps(summary, option=orjson.OPT_NON_STR_KEYS))
 
     def load_summary(self, content_id: str) -> Optional[Dict[str, Any]]:
-        path = self.summary_dir / f"{content_id}.json"
-        if not path.exists():
+        try:
+            data = (self.summary_dir / f"{content_id}.json").read_bytes()
+        except FileNotFoundError:
             return None
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return orjson.loads(data)
+
+    def load_all_raw(self, source_type: str) -> Dict[str, Dict[str, Any]]:
+        return self._load_directory(self.raw_dir / source_type)
+
+    def load_all_summaries(self) -> Dict[str, Dict[str, Any]]:
+        return self._load_directory(self.summary_dir)
+
+    @staticmethod
+    def _load_directory(directory: Path) -> Dict[str, Dict[str, Any]]:
+        loaded: Dict[str, Dict[str, Any]] = {}
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            return loaded
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                with open(entry.path, "rb") as handle:
+                    loaded[entry.name[: -len(".json")]] = orjson.loads(handle.read())
+        return loaded
 
     @staticmethod
     def _utc_now() -> str:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import os
-import json
 from pathlib import Path
 
+import orjson
+
 BASE_DIR = Path(__file__).resolve().parent
 
 
@@ -52,6 +53,6 @@ def get_user_settings() -> dict:
     if not USER_SETTINGS_FILE.exists():
         return {}
     try:
-        return json.loads(USER_SETTINGS_FILE.read_text(encoding="utf-8"))
+        return orjson.loads(USER_SETTINGS_FILE.read_bytes())
     except Exception:
         return {}
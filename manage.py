@@ -3,15 +3,16 @@ from __future__ import annotations
 
 import argparse
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Set
 
 from cache_manager import CacheManager
 from pipeline.content_index import ContentIndex
 from pipeline.blog_ingestor import BlogIngestor
 from pipeline.youtube_ingestor import YouTubeIngestor
 from pipeline.readinglist_parser import ReadingListParser, ReadingListEntry
-from summarizer import summarize_all, SummarizationError
+from summarizer import Summarizer, summarize_all, SummarizationError
 from youtube_channel_tracker import YouTubeChannelTracker
 
 
@@ -30,28 +31,48 @@ def run_refresh(reading_list_path: Path, *, skip_summaries: bool = False) -> Non
     blog_ingestor = BlogIngestor(cache)
     yt_ingestor = YouTubeIngestor(cache)
 
-    if blog_entries:
-        print(f"📚 Fetching content from {len(blog_entries)} blog sources...")
-        blog_ingestor.ingest(blog_entries, index)
-
-    if youtube_entries:
-        print(f"🎬 Fetching content from {len(youtube_entries)} YouTube sources...")
-        yt_ingestor.ingest(youtube_entries, index)
-
-    if skip_summaries:
+    summarizer: Optional[Summarizer] = None
+    if not skip_summaries:
+        try:
+            summarizer = Summarizer(cache)
+        except SummarizationError as exc:
+            print(f"⚠️  Summarization skipped: {exc}")
+
+    # summarize_all saves on its own; defer that so the deduped index is written once per refresh.
+    # Blog summaries run on a background thread while YouTube sources are still being fetched.
+    # Both threads upsert into the same index; ContentIndex.upsert/save take its lock, and nothing
+    # iterates index.all() until the background summaries have finished.
+    with index.deferred_save(), ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary") as summary_pool:
+        blog_summaries: Optional[Future] = None
+        summarized_ids: Set[str] = set()
+        if blog_entries:
+            print(f"📚 Fetching content from {len(blog_entries)} blog sources...")
+            blog_content = blog_ingestor.ingest(blog_entries, index)
+            if summarizer:
+                blog_records = [index.get(item.content_id) for item in blog_content]
+                summarized_ids.update(item.content_id for item in blog_content)
+                blog_summaries = summary_pool.submit(
+                    summarize_all, index, cache, records=blog_records, summarizer=summarizer
+                )
+
+        if youtube_entries:
+            print(f"🎬 Fetching content from {len(youtube_entries)} YouTube sources...")
+            yt_ingestor.ingest(youtube_entries, index)
+
+        if summarizer is None:
+            index.dedupe_by_url()
+            index.save()
+            if skip_summaries:
+                print("✅ Content index updated (summaries skipped)")
+            return
+
+        if blog_summaries is not None:
+            blog_summaries.result()
+        remaining = [record for record in index.all() if record.content_id not in summarized_ids]
+        summarize_all(index, cache, records=remaining, summarizer=summarizer)
         index.dedupe_by_url()
         index.save()
-        print("✅ Content index updated (summaries skipped)")
-        return
-
-    try:
-        summarize_all(index, cache)
-        index.dedupe_by_url()
         print("✅ Content index updated with summaries")
-    except SummarizationError as exc:
-        print(f"⚠️  Summarization skipped: {exc}")
-        index.dedupe_by_url()
-        index.save()
 
 
 def main() -> None:
@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 import hashlib
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, List
+from typing import Dict, Iterable, Iterator, List, Set
+from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from cache_manager import CacheManager
 from pipeline.content_index import ContentIndex
 from pipeline.readinglist_parser import ReadingListEntry
+from pipeline.urls import join_url
 
 
-@dataclass
+@dataclass(slots=True)
 class BlogContent:
     content_id: str
     title: str
@@ -27,72 +33,238 @@ class BlogContent:
     raw_path: str
 
 
+BOILERPLATE_SELECTOR = "script, style, nav, header, footer, aside, .sidebar"
+DATE_SELECTORS = [
+    "time[datetime]",
+    "meta[property='article:published_time']",
+    "meta[name='date']",
+    "meta[name='pubdate']",
+]
+AUTHOR_SELECTORS = [
+    "meta[name='author']",
+    "meta[property='article:author']",
+    ".author",
+    ".post-author",
+]
+
+
+def _parse_article(html: str) -> dict:
+    # Kept free of ingestor state so parsing can move off the fetch threads if it ever dominates.
+    tree = LexborHTMLParser(html)
+
+    for element in tree.css(BOILERPLATE_SELECTOR):
+        element.decompose()
+
+    paragraphs: List[str] = []
+    for node in tree.css("p"):
+        paragraph = node.text(strip=True)
+        if len(paragraph) > 40:
+            paragraphs.append(paragraph)
+            if len(paragraphs) == 80:
+                break
+    text = "\n\n".join(paragraphs)
+
+    return {
+        "text": text,
+        "published_at": _extract_date(tree),
+        "author": _extract_author(tree),
+    }
+
+
+def _extract_date(tree: LexborHTMLParser) -> str | None:
+    for selector in DATE_SELECTORS:
+        element = tree.css_first(selector)
+        if element is None:
+            continue
+        attributes = element.attributes
+        if "datetime" in attributes:
+            return attributes["datetime"] or ""
+        if "content" in attributes:
+            return attributes["content"] or ""
+        text = element.text(strip=True)
+        if text:
+            return text
+    return None
+
+
+def _extract_author(tree: LexborHTMLParser) -> str | None:
+    for selector in AUTHOR_SELECTORS:
+        element = tree.css_first(selector)
+        if element is None:
+            continue
+        attributes = element.attributes
+        if "content" in attributes:
+            return (attributes["content"] or "").strip()
+        text = element.text(strip=True)
+        if text:
+            return text
+    return None
+
+
 class BlogIngestor:
-    def __init__(self, cache: CacheManager, *, session: requests.Session | None = None):
+    POST_LINK_SELECTOR = ", ".join(
+        [
+            "article h1 a",
+            "article h2 a",
+            "article .title a",
+            ".post-title a",
+            ".entry-title a",
+            "main h2 a",
+            "main h3 a",
+            ".content h2 a",
+        ]
+    )
+
+    NON_CONTENT_PATTERN = re.compile(
+        "|".join(
+            re.escape(token)
+            for token in [
+                "privacy",
+                "terms",
+                "about",
+                "contact",
+                "login",
+                "search",
+                "tag",
+                "category",
+                "rss",
+                "feed",
+                "subscribe",
+                "share",
+                "comment",
+                "?",
+            ]
+        )
+    )
+
+    def __init__(
+        self,
+        cache: CacheManager,
+        *,
+        session: requests.Session | None = None,
+        max_workers: int = 16,
+        per_host_limit: int = 2,
+        host_interval: float = 0.5,
+    ):
         self.cache = cache
+        self.max_workers = max_workers
         self.session = session or self._build_session()
+        self.per_host_limit = per_host_limit
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        self.host_interval = host_interval
+        self._next_index_fetch: Dict[str, float] = {}
+        self._next_index_fetch_lock = threading.Lock()
 
     def ingest(self, entries: Iterable[ReadingListEntry], index: ContentIndex) -> List[BlogContent]:
+        entries = list(entries)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="blog") as pool:
+            post_lists = list(pool.map(lambda entry: self._fetch_recent_posts(entry.url), entries))
+            # Cross-posted articles are fetched once, for the first source that lists them.
+            seen_urls: Set[str] = set()
+            jobs = []
+            for entry, posts in zip(entries, post_lists):
+                for post in posts:
+                    if post["url"] in seen_urls:
+                        continue
+                    seen_urls.add(post["url"])
+                    jobs.append((entry, post))
+            articles = list(pool.map(lambda job: self._download_and_cache(*job), jobs))
+
         collected: List[BlogContent] = []
-        for entry in entries:
-            posts = self._fetch_recent_posts(entry.url)
-            for post in posts:
-                article_data = self._download_article(post["url"])
-                if not article_data["text"]:
-                    continue
-
-                combined_hash = self.cache.sha256(article_data["text"])
-                content_id = hashlib.sha1(post["url"].encode("utf-8")).hexdigest()
-
-                if not self.cache.raw_is_current("blogs", content_id, combined_hash):
-                    payload = {
-                        "content_hash": combined_hash,
-                        "title": post["title"],
-                        "author": article_data["author"],
-                        "published_at": article_data["published_at"],
-                        "original_url": post["url"],
-                        "text": article_data["text"],
-                        "categories": [entry.category],
-                        "tags": entry.tags,
-                    }
-                    self.cache.save_raw("blogs", content_id, payload)
-
-                raw_path = str(self.cache.raw_path("blogs", content_id))
-                collected.append(
-                    BlogContent(
-                        content_id=content_id,
-                        title=post["title"],
-                        author=article_data["author"],
-                        published_at=article_data["published_at"],
-                        url=post["url"],
-                        text=article_data["text"],
-                        categories=[entry.category],
-                        tags=entry.tags,
-                        raw_path=raw_path,
-                    )
-                )
+        seen_content: Set[str] = set()
+        for (entry, post), article_data in zip(jobs, articles):
+            if article_data is None or article_data["content_hash"] in seen_content:
+                continue
+            seen_content.add(article_data["content_hash"])
 
-                record = ContentIndex.build_record(
+            content_id = article_data["content_id"]
+            raw_file = self.cache.raw_path("blogs", content_id)
+            raw_path = str(raw_file)
+            collected.append(
+                BlogContent(
                     content_id=content_id,
-                    source_type="blog_article",
-                    origin=entry.source_type,
-                    original_url=post["url"],
                     title=post["title"],
-                    raw_path=self.cache.raw_path("blogs", content_id),
-                    summary_path=None,
-                    published_at=article_data["published_at"],
                     author=article_data["author"],
+                    published_at=article_data["published_at"],
+                    url=post["url"],
+                    text=article_data["text"],
                     categories=[entry.category],
                     tags=entry.tags,
+                    raw_path=raw_path,
                 )
-                index.upsert(record)
+            )
 
-            time.sleep(0.5)
+            record = ContentIndex.build_record(
+                content_id=content_id,
+                source_type="blog_article",
+                origin=entry.source_type,
+                original_url=post["url"],
+                title=post["title"],
+                raw_path=raw_file,
+                summary_path=None,
+                published_at=article_data["published_at"],
+                author=article_data["author"],
+                categories=[entry.category],
+                tags=entry.tags,
+            )
+            index.upsert(record)
 
         return collected
 
+    def _download_and_cache(self, entry: ReadingListEntry, post: dict) -> dict | None:
+        article_data = self._download_article(post["url"])
+        if not article_data["text"]:
+            return None
+
+        combined_hash = self.cache.sha256(article_data["text"])
+        content_id = self._content_id(post["url"])
+
+        if not self.cache.raw_is_current("blogs", content_id, combined_hash):
+            payload = {
+                "content_hash": combined_hash,
+                "title": post["title"],
+                "author": article_data["author"],
+                "published_at": article_data["published_at"],
+                "original_url": post["url"],
+                "text": article_data["text"],
+                "categories": [entry.category],
+                "tags": entry.tags,
+            }
+            self.cache.save_raw("blogs", content_id, payload)
+
+        return {**article_data, "content_id": content_id, "content_hash": combined_hash}
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+        with slot:
+            yield
+
+    def _throttle(self, url: str) -> None:
+        """Space out index-page fetches to the same host without delaying other hosts."""
+        host = urlparse(url).netloc
+        with self._next_index_fetch_lock:
+            now = time.monotonic()
+            start = max(now, self._next_index_fetch.get(host, now))
+            self._next_index_fetch[host] = start + self.host_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def _get(self, url: str, headers: Dict[str, str] | None = None) -> requests.Response:
+        with self._host_slot(url):
+            return self.session.get(url, timeout=15, headers=headers)
+
     def _build_session(self) -> requests.Session:
         session = requests.Session()
+        # Size the pools to the worker count so concurrent fetches keep their keep-alive connections.
+        adapter = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=max(self.max_workers, 32))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
@@ -102,139 +274,82 @@ class BlogIngestor:
         return session
 
     def _fetch_recent_posts(self, base_url: str, limit: int = 5) -> List[dict]:
+        self._throttle(base_url)
         try:
-            response = self.session.get(base_url, timeout=15)
+            response = self._get(base_url)
             response.raise_for_status()
         except requests.RequestException as exc:
             print(f"  ⚠️ Unable to fetch posts from {base_url}: {exc}")
             return []
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        selectors = [
-            "article h1 a",
-            "article h2 a",
-            "article .title a",
-            ".post-title a",
-            ".entry-title a",
-            "main h2 a",
-            "main h3 a",
-            ".content h2 a",
-        ]
+        tree = LexborHTMLParser(response.text)
 
+        base = urlparse(base_url)
+        base_netloc = base.netloc
+        root = f"{base.scheme}://{base_netloc}"
         articles: List[dict] = []
         seen = set()
-        for selector in selectors:
-            for link in soup.select(selector):
-                href = link.get("href")
-                title = link.get_text(strip=True)
-                if not href or not title:
-                    continue
-                if href.startswith("#"):
-                    continue
-                full_url = requests.compat.urljoin(base_url, href)
-                if full_url in seen:
-                    continue
-                seen.add(full_url)
-                if self._looks_like_article(href, title, base_url):
-                    articles.append({"title": title, "url": full_url})
-                if len(articles) >= limit:
-                    break
+        for link in tree.css(self.POST_LINK_SELECTOR):
+            href = link.attributes.get("href")
+            title = link.text(strip=True)
+            if not href or not title:
+                continue
+            if href.startswith("#"):
+                continue
+            full_url = join_url(base_url, root, href)
+            if full_url in seen:
+                continue
+            seen.add(full_url)
+            if self._looks_like_article(href, title, base_netloc):
+                articles.append({"title": title, "url": full_url})
             if len(articles) >= limit:
                 break
 
         return articles
 
-    def _looks_like_article(self, href: str, title: str, base_url: str) -> bool:
+    def _looks_like_article(self, href: str, title: str, base_netloc: str) -> bool:
         href_lower = href.lower()
-        title_lower = title.lower()
-        non_content_tokens = [
-            "privacy",
-            "terms",
-            "about",
-            "contact",
-            "login",
-            "search",
-            "tag",
-            "category",
-            "rss",
-            "feed",
-            "subscribe",
-            "share",
-            "comment",
-            "?",
-        ]
-        if any(token in href_lower for token in non_content_tokens):
+        if self.NON_CONTENT_PATTERN.search(href_lower):
             return False
-        if len(title_lower.split()) < 3:
+        if len(title.split()) < 3:
             return False
-        if href_lower.startswith("http") and requests.compat.urlparse(href).netloc != requests.compat.urlparse(base_url).netloc:
+        if href_lower.startswith("http") and urlparse(href).netloc != base_netloc:
             return False
         return True
 
+    @staticmethod
+    def _content_id(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
     def _download_article(self, url: str) -> dict:
+        cached = self.cache.load_raw("blogs", self._content_id(url))
+        validators = self.cache.load_http_validators(url)
+        headers: Dict[str, str] = {}
+        if cached and cached.get("text"):
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
         try:
-            response = self.session.get(url, timeout=15)
+            response = self._get(url, headers=headers or None)
             response.raise_for_status()
         except requests.RequestException as exc:
             return {"text": None, "published_at": None, "author": None, "error": str(exc)}
-        soup = BeautifulSoup(response.text, "html.parser")
 
-        for element in soup(["script", "style", "nav", "header", "footer", "aside", ".sidebar"]):
-            element.decompose()
+        if response.status_code == 304 and headers:
+            return {
+                "text": cached["text"],
+                "published_at": cached.get("published_at"),
+                "author": cached.get("author"),
+            }
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (etag or last_modified) and (etag, last_modified) != (
+            validators.get("etag"),
+            validators.get("last_modified"),
+        ):
+            self.cache.save_http_validators(url, etag=etag, last_modified=last_modified)
 
-        paragraphs = [
-            p.get_text(strip=True)
-            for p in soup.find_all("p")
-            if len(p.get_text(strip=True)) > 40
-        ]
-        text = "\n\n".join(paragraphs[:80])
-
-        published_at = self._extract_date(soup)
-        author = self._extract_author(soup)
-
-        return {
-            "text": text,
-            "published_at": published_at,
-            "author": author,
-        }
-
-    def _extract_date(self, soup: BeautifulSoup) -> str | None:
-        selectors = [
-            "time[datetime]",
-            "meta[property='article:published_time']",
-            "meta[name='date']",
-            "meta[name='pubdate']",
-        ]
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if not element:
-                continue
-            if element.has_attr("datetime"):
-                return element["datetime"]
-            if element.has_attr("content"):
-                return element["content"]
-            text = element.get_text(strip=True)
-            if text:
-                return text
-        return None
-
-    def _extract_author(self, soup: BeautifulSoup) -> str | None:
-        selectors = [
-            "meta[name='author']",
-            "meta[property='article:author']",
-            ".author",
-            ".post-author",
-        ]
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if not element:
-                continue
-            if element.has_attr("content"):
-                return element["content"].strip()
-            text = element.get_text(strip=True)
-            if text:
-                return text
-        return None
+        return _parse_article(response.text)
 
 
 __all__ = ["BlogIngestor", "BlogContent"]
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, asdict
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import orjson
 
 from config import CONTENT_INDEX_FILE
 
 
+@lru_cache(maxsize=4096)
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
 @dataclass
 class ContentRecord:
     content_id: str
@@ -29,62 +44,120 @@ class ContentIndex:
     def __init__(self, path: Path = CONTENT_INDEX_FILE):
         self.path = Path(path)
         self._records: Dict[str, ContentRecord] = {}
+        self._mtime_ns: Optional[int] = None
+        self._saved_bytes: Optional[bytes] = None
+        # content_id -> (published_at, parsed datetime), filled at load/upsert time for dedupe_by_url.
+        self._published_at: Dict[str, Tuple[Optional[str], Optional[datetime]]] = {}
+        self._defer_depth = 0
+        self._save_pending = False
+        self._lock = threading.Lock()
         self._load()
 
     def _load(self) -> None:
         if not self.path.exists():
             self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._records = {}
+            self._published_at = {}
+            self._mtime_ns = None
+            self._saved_bytes = None
             return
-        with self.path.open("r", encoding="utf-8") as handle:
-            raw_records = json.load(handle)
+        mtime_ns = self.path.stat().st_mtime_ns
+        data = self.path.read_bytes()
+        raw_records = orjson.loads(data)
+        records: Dict[str, ContentRecord] = {}
+        published_at: Dict[str, Tuple[Optional[str], Optional[datetime]]] = {}
         for item in raw_records:
             if "origin" not in item:
                 item["origin"] = None
             record = ContentRecord(**item)
-            self._records[record.content_id] = record
+            records[record.content_id] = record
+            published_at[record.content_id] = (record.published_at, _parse_date(record.published_at))
+        # Swap in the new mapping whole so concurrent readers never see a partial load.
+        self._records = records
+        self._published_at = published_at
+        self._mtime_ns = mtime_ns
+        self._saved_bytes = data
+
+    def reload(self) -> None:
+        with self._lock:
+            self._load()
+
+    def reload_if_modified(self) -> None:
+        try:
+            mtime_ns: Optional[int] = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if mtime_ns != self._mtime_ns:
+            self.reload()
 
     def upsert(self, record: ContentRecord) -> None:
-        self._records[record.content_id] = record
+        published_at = (record.published_at, _parse_date(record.published_at))
+        # refresh summarizes on a worker thread while ingestion upserts on the main thread.
+        with self._lock:
+            self._records[record.content_id] = record
+            self._published_at[record.content_id] = published_at
+
+    def _published_at_dt(self, record: ContentRecord) -> Optional[datetime]:
+        cached = self._published_at.get(record.content_id)
+        if cached is None or cached[0] != record.published_at:
+            cached = (record.published_at, _parse_date(record.published_at))
+            self._published_at[record.content_id] = cached
+        return cached[1]
 
     def get(self, content_id: str) -> Optional[ContentRecord]:
         return self._records.get(content_id)
 
+    @contextmanager
+    def deferred_save(self) -> Iterator[None]:
+        """Hold save() calls until the block exits normally, then write the index once."""
+        self._defer_depth += 1
+        try:
+            yield
+        finally:
+            self._defer_depth -= 1
+        if not self._defer_depth and self._save_pending:
+            self.save()
+
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as handle:
-            json.dump([asdict(record) for record in self._records.values()], handle, indent=2, ensure_ascii=False)
+        with self._lock:
+            if self._defer_depth:
+                self._save_pending = True
+                return
+            self._save_pending = False
+            data = orjson.dumps(list(self._records.values()), option=orjson.OPT_INDENT_2)
+            if data == self._saved_bytes and self.path.exists():
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write beside the index and rename so readers never observe a half-written file.
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.path)
+            self._mtime_ns = self.path.stat().st_mtime_ns
+            self._saved_bytes = data
 
     def all(self) -> Iterable[ContentRecord]:
         return self._records.values()
 
     def dedupe_by_url(self) -> None:
-        by_url: Dict[str, List[ContentRecord]] = {}
+        # Undated records rank first, then newest publication date, then latest update;
+        # ties keep the record that was inserted first.
+        fallback = datetime.min.replace(tzinfo=timezone.utc)
+        best: Dict[str, Tuple[Tuple[bool, datetime, str], ContentRecord]] = {}
         for record in self._records.values():
-            by_url.setdefault(record.original_url, []).append(record)
-
-        def _parse_date(value: Optional[str]) -> Optional[datetime]:
-            if not value:
-                return None
-            try:
-                return datetime.fromisoformat(value.replace("Z", "+00:00"))
-            except ValueError:
-                return None
-
-        for url, records in by_url.items():
-            if len(records) <= 1:
-                continue
-            records.sort(
-                key=lambda item: (
-                    _parse_date(item.published_at) is None,
-                    _parse_date(item.published_at) or datetime.min.replace(tzinfo=timezone.utc),
-                    item.last_updated,
-                ),
-                reverse=True,
-            )
-            keep = records[0].content_id
-            for record in records[1:]:
-                if record.content_id != keep and record.content_id in self._records:
-                    del self._records[record.content_id]
+            parsed = self._published_at_dt(record)
+            key = (parsed is None, parsed or fallback, record.last_updated)
+            current = best.get(record.original_url)
+            if current is None or key > current[0]:
+                best[record.original_url] = (key, record)
+
+        if len(best) != len(self._records):
+            keep = {record.content_id for _, record in best.values()}
+            self._records = {
+                content_id: record for content_id, record in self._records.items() if content_id in keep
+            }
+            self._published_at = {
+                content_id: value for content_id, value in self._published_at.items() if content_id in keep
+            }
 
     @staticmethod
     def build_record(
@@ -3,7 +3,7 @@ from __future__ import annotations
 import dataclasses
 import re
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclasses.dataclass
@@ -47,6 +47,7 @@ class ReadingListParser:
 
     URL_PATTERN = re.compile(r"https?://[^\s)]+", re.IGNORECASE)
     CATEGORY_PREFIX_PATTERN = re.compile(r"^\-?\s*\[([^\]]+)\]\s*:?")
+    CANDIDATE_LINE_PATTERN = re.compile(r"^[^\S\n]*(?:#|.*?https?://).*$", re.IGNORECASE | re.MULTILINE)
     KV_PATTERN = re.compile(r"(?P<key>tags?|category|author)\s*:\s*(?P<value>[^|]+)", re.IGNORECASE)
 
     def __init__(self, markdown_path: Path):
@@ -58,10 +59,10 @@ class ReadingListParser:
         entries: List[ReadingListEntry] = []
         current_section: Optional[str] = None
 
-        for raw_line in self._iter_lines():
-            line = raw_line.strip()
-            if not line:
-                continue
+        text = self.markdown_path.read_text(encoding="utf-8")
+        # Only header lines and lines carrying a URL can change the result; skip the rest in C.
+        for match in self.CANDIDATE_LINE_PATTERN.finditer(text):
+            line = match.group(0).strip()
 
             section = self._extract_section(line)
             if section:
@@ -77,11 +78,6 @@ class ReadingListParser:
 
         return entries
 
-    def _iter_lines(self) -> Iterable[str]:
-        with self.markdown_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                yield line
-
     def _extract_section(self, line: str) -> Optional[str]:
         if line.startswith("#"):
             header = line.lstrip("#").strip().lower()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import re
+from urllib.parse import urljoin
+
+_URL_UNSAFE_RE = re.compile(r"[\t\r\n]")
+
+
+def join_url(base_url: str, root: str, href: str) -> str:
+    """Return urljoin(base_url, href), skipping urljoin for plain absolute and root-relative links.
+
+    ``root`` is the scheme and netloc of ``base_url`` (e.g. ``"https://example.com"``).
+    """
+    # urljoin rewrites dot segments, drops empty params/query/fragment, strips tabs and newlines
+    # and validates hosts; anything that could trigger one of those takes the slow path.
+    if (
+        "/." not in href
+        and ";" not in href
+        and "?#" not in href
+        and href[-1:] not in ("?", "#")
+        and not _URL_UNSAFE_RE.search(href)
+    ):
+        if href.startswith(("https://", "http://")):
+            netloc_start = href.index("//") + 2
+            if (
+                href[netloc_start : netloc_start + 1] not in ("", "/", "?", "#")
+                and href.isascii()
+                and "[" not in href
+                and "]" not in href
+            ):
+                return href
+        elif href.startswith("/") and not href.startswith("//"):
+            return root + href
+    return urljoin(base_url, href)
+
+
+__all__ = ["join_url"]
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import io
 import os
 import re
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util.retry import Retry
 from xml.etree import ElementTree
 
 from cache_manager import CacheManager
@@ -19,7 +26,49 @@ from youtube_channel_tracker import YouTubeChannelTracker
 from youtube_transcript import extract_video_id
 
 
-@dataclass
+_CHANNEL_ID_RE = re.compile(r'"channelId":"([A-Za-z0-9_-]{24})"')
+# A bare channel id, or a URL whose last path segment after "channel/" is one.
+_LOCAL_CHANNEL_ID_RE = re.compile(r"UC.{22}|.*channel/(?:.*/)?(UC[^/]{22})/*", re.DOTALL)
+_CHANNEL_PATH_RE = re.compile(r"channel/([A-Za-z0-9_-]{24})")
+_YT_INITIAL_DATA_RE = re.compile(r"ytInitialData\s*=\s*(\{.*?\})\s*;", re.DOTALL)
+_RELATIVE_TIME_RE = re.compile(r"(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_TRAILING_DIGITS_RE = re.compile(r"\d+$")
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+_ATOM_ENTRY = f"{_ATOM}entry"
+_ATOM_TITLE = f"{_ATOM}title"
+_ATOM_PUBLISHED = f"{_ATOM}published"
+_ATOM_AUTHOR_NAME = f"{_ATOM}author/{_ATOM}name"
+_YT_VIDEO_ID = f"{_YT}videoId"
+
+
+@lru_cache(maxsize=8192)
+def _slugify(value: str) -> str:
+    return _NON_ALNUM_RE.sub("", value.lower())
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> Optional[datetime]:
+    # Merging and date hydration check the same publish strings, often several times per video.
+    # Every ISO 8601 form starts with a four-digit year, so relative text like "3 days ago" exits here.
+    if not value[:4].isdigit():
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _meta_content(tree: LexborHTMLParser, selector: str) -> Optional[str]:
+    node = tree.css_first(selector)
+    if node is None or "content" not in node.attributes:
+        return None
+    return node.attributes["content"] or ""
+
+
+@dataclass(slots=True)
 class YouTubeContent:
     content_id: str
     title: str
@@ -34,71 +83,66 @@ class YouTubeContent:
 
 class YouTubeIngestor:
     CHANNEL_VIDEO_LIMIT = 30
+    CHANNEL_CACHE_TTL = 600
 
-    def __init__(self, cache: CacheManager, *, session: requests.Session | None = None):
+    def __init__(self, cache: CacheManager, *, session: requests.Session | None = None, max_workers: int = 8):
         self.cache = cache
+        self.max_workers = max_workers
         self.session = session or self._build_session()
         self.tracker = YouTubeChannelTracker()
-        self._channel_cache: dict[str, List[dict]] = {}
+        self._channel_cache: dict[str, Tuple[float, List[dict]]] = {}
+        self._resolve_cache: dict[str, Optional[str]] = {}
+        self._flight_locks: dict[str, threading.Lock] = {}
+        self._flight_locks_lock = threading.Lock()
+        self._store_index: Optional[Tuple[List[dict], Dict[str, List[int]], Dict[str, List[int]]]] = None
+        self._store_matches: Dict[Tuple[Optional[str], str, str, int], List[dict]] = {}
+        self._ingest_now: Optional[datetime] = None
+        self._metadata_pool: Optional[Executor] = None
 
     def ingest(self, entries: Iterable[ReadingListEntry], index: ContentIndex) -> List[YouTubeContent]:
-        collected: List[YouTubeContent] = []
-        for entry in entries:
-            if entry.source_type == "youtube_channel":
-                channel_id = self._extract_channel_id_local(entry.url)
-                if not channel_id:
-                    channel_id = self._resolve_channel_id(entry.url)
-                    if channel_id:
-                        print(f"  ℹ️ Resolved channel ID {channel_id} for {entry.url}")
-                local_videos = self._videos_from_store(entry, channel_id)
-                remote_videos: List[dict] = []
-                if channel_id:
-                    remote_videos = self._fetch_channel_videos(channel_id, limit=self.CHANNEL_VIDEO_LIMIT)
-                videos = self._merge_videos(local_videos, remote_videos, limit=self.CHANNEL_VIDEO_LIMIT)
-                if not videos:
-                    print(f"  ⚠️ No videos available for {entry.url}")
-                    continue
-            else:
-                video_id = extract_video_id(entry.url)
-                if not video_id:
-                    print(f"  ⚠️ Unable to extract video ID for {entry.url}")
-                    continue
-                video_data = self._video_from_store(video_id)
-                if not video_data:
-                    video_data = self._fetch_single_video_metadata(video_id)
-                if not video_data:
-                    print(f"  ⚠️ No metadata available for video {entry.url}")
-                    continue
-                videos = [video_data]
+        entries = list(entries)
+        self._index_store()
+        self._ingest_now = datetime.now(timezone.utc)
+        # Channel resolution, feed and metadata requests are independent per entry; run them concurrently
+        # and keep transcript loading, caching and index updates on this thread in reading-list order.
+        # Metadata hydration for every entry shares one pool, so at most 2 * max_workers requests are in flight.
+        metadata_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="youtube-meta")
+        with metadata_pool, ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="youtube") as pool:
+            self._metadata_pool = metadata_pool
+            try:
+                video_lists = list(pool.map(self._collect_videos, entries))
+            finally:
+                self._metadata_pool = None
 
+        collected: List[YouTubeContent] = []
+        for entry, videos in zip(entries, video_lists):
             for video in videos:
-                if not video:
-                    continue
-                if not self._is_iso_date(video.get("published_at")):
-                    self._hydrate_published_at(video)
-                if not self._is_iso_date(video.get("published_at")):
-                    video_id = video.get("video_id") or extract_video_id(video.get("url", ""))
-                    if video_id:
-                        metadata = self._fetch_single_video_metadata(video_id)
-                        if metadata and metadata.get("published_at"):
-                            video["published_at"] = metadata.get("published_at")
-                            if not video.get("channel_name"):
-                                video["channel_name"] = metadata.get("channel_name")
-                            if not video.get("channel_id"):
-                                video["channel_id"] = metadata.get("channel_id")
-                transcript_text, transcript_error = self._load_transcript(video)
                 video_id = video.get("video_id") or extract_video_id(video.get("url", ""))
-                content_id = video_id or hashlib.sha1(video["url"].encode()).hexdigest()
                 if video_id:
                     video["video_id"] = video_id
-                if transcript_text:
-                    content_hash = self.cache.sha256(transcript_text)
+                content_id = video_id or hashlib.sha1(video["url"].encode()).hexdigest()
+                cached_raw = self.cache.load_raw("youtube", content_id) or {}
+                cached_stamp = cached_raw.get("transcript_stamp")
+                if cached_stamp and self._transcript_stamp(video) == cached_stamp:
+                    # The transcript file is untouched since it was cached; reuse the cached text
+                    # instead of reading and re-hashing it.
+                    transcript_text = cached_raw.get("transcript")
+                    transcript_error = cached_raw.get("transcript_error")
+                    needs_save = False
                 else:
-                    fallback_basis = (video.get("title") or "") + (video.get("published_at") or "")
-                    content_hash = self.cache.sha256(fallback_basis or video.get("url") or content_id)
+                    transcript_text, transcript_error, transcript_stamp = self._load_transcript(video)
+                    if transcript_text:
+                        content_hash = self.cache.sha256(transcript_text)
+                    else:
+                        fallback_basis = (video.get("title") or "") + (video.get("published_at") or "")
+                        content_hash = self.cache.sha256(fallback_basis or video.get("url") or content_id)
+                    needs_save = (
+                        cached_raw.get("content_hash") != content_hash
+                        or cached_raw.get("transcript_stamp") != transcript_stamp
+                    )
 
                 canonical_url = f"https://www.youtube.com/watch?v={video_id}" if video_id else video["url"]
-                if not self.cache.raw_is_current("youtube", content_id, content_hash):
+                if needs_save:
                     payload = {
                         "content_hash": content_hash,
                         "title": video["title"],
@@ -109,19 +153,21 @@ class YouTubeIngestor:
                         "transcript": transcript_text or "",
                         "transcript_available": bool(transcript_text),
                         "transcript_error": transcript_error,
+                        "transcript_stamp": transcript_stamp,
                         "categories": [entry.category],
                         "tags": entry.tags,
                     }
                     self.cache.save_raw("youtube", content_id, payload)
 
-                raw_path = str(self.cache.raw_path("youtube", content_id))
+                raw_file = self.cache.raw_path("youtube", content_id)
+                raw_path = str(raw_file)
                 record = ContentIndex.build_record(
                     content_id=content_id,
                     source_type="youtube_video",
                     origin=entry.source_type,
                     original_url=canonical_url,
                     title=video["title"],
-                    raw_path=self.cache.raw_path("youtube", content_id),
+                    raw_path=raw_file,
                     summary_path=None,
                     published_at=video.get("published_at"),
                     author=video.get("channel_name"),
@@ -151,8 +197,72 @@ class YouTubeIngestor:
 
         return collected
 
+    def _collect_videos(self, entry: ReadingListEntry) -> List[dict]:
+        if entry.source_type == "youtube_channel":
+            channel_id = self._extract_channel_id_local(entry.url)
+            if not channel_id:
+                channel_id = self._resolve_channel_id(entry.url)
+                if channel_id:
+                    print(f"  ℹ️ Resolved channel ID {channel_id} for {entry.url}")
+            local_videos = self._videos_from_store(entry, channel_id)
+            remote_videos: List[dict] = []
+            if channel_id:
+                remote_videos = self._fetch_channel_videos(channel_id, limit=self.CHANNEL_VIDEO_LIMIT)
+            videos = self._merge_videos(local_videos, remote_videos, limit=self.CHANNEL_VIDEO_LIMIT)
+            if not videos:
+                print(f"  ⚠️ No videos available for {entry.url}")
+                return []
+        else:
+            video_id = extract_video_id(entry.url)
+            if not video_id:
+                print(f"  ⚠️ Unable to extract video ID for {entry.url}")
+                return []
+            video_data = self._video_from_store(video_id)
+            if not video_data:
+                video_data = self._fetch_single_video_metadata(video_id)
+            if not video_data:
+                print(f"  ⚠️ No metadata available for video {entry.url}")
+                return []
+            videos = [video_data]
+
+        hydrated = [video for video in videos if video]
+        needs_metadata: List[Tuple[dict, str]] = []
+        for video in hydrated:
+            if not self._is_iso_date(video.get("published_at")):
+                self._hydrate_published_at(video)
+            if not self._is_iso_date(video.get("published_at")):
+                video_id = video.get("video_id") or extract_video_id(video.get("url", ""))
+                if video_id:
+                    video["video_id"] = video_id
+                    needs_metadata.append((video, video_id))
+
+        metadata_pool = self._metadata_pool
+        if metadata_pool is not None and len(needs_metadata) > 1:
+            metadata_list = list(
+                metadata_pool.map(self._fetch_single_video_metadata, [vid for _, vid in needs_metadata])
+            )
+        else:
+            metadata_list = [self._fetch_single_video_metadata(vid) for _, vid in needs_metadata]
+
+        for (video, _), metadata in zip(needs_metadata, metadata_list):
+            if metadata and metadata.get("published_at"):
+                video["published_at"] = metadata.get("published_at")
+                if not video.get("channel_name"):
+                    video["channel_name"] = metadata.get("channel_name")
+                if not video.get("channel_id"):
+                    video["channel_id"] = metadata.get("channel_id")
+        return hydrated
+
     def _build_session(self) -> requests.Session:
         session = requests.Session()
+        # Entry collection and metadata hydration both fan out, so size the pool past the worker count
+        # and retry transient throttling/server errors instead of dropping the video.
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32, pool_maxsize=max(2 * self.max_workers, 32), max_retries=retries
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
@@ -169,21 +279,39 @@ class YouTubeIngestor:
         if channel_url.startswith("UC") and len(channel_url) == 24:
             return channel_url
 
-        response = self.session.get(channel_url, timeout=15)
-        response.raise_for_status()
-        patterns = [
-            r'"channelId":"([A-Za-z0-9_-]{24})"',
-            r'channel/([A-Za-z0-9_-]{24})',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, response.text)
-            if match:
-                return match.group(1)
-        return None
+        with self._single_flight(f"resolve:{channel_url}"):
+            if channel_url not in self._resolve_cache:
+                response = self.session.get(channel_url, timeout=15)
+                response.raise_for_status()
+                channel_id = None
+                for pattern in (_CHANNEL_ID_RE, _CHANNEL_PATH_RE):
+                    match = pattern.search(response.text)
+                    if match:
+                        channel_id = match.group(1)
+                        break
+                self._resolve_cache[channel_url] = channel_id
+            return self._resolve_cache[channel_url]
 
     def _fetch_channel_videos(self, channel_id: str, limit: int = 30) -> List[dict]:
         if not channel_id or len(channel_id) < 6:
             return []
+        key = f"{channel_id}:{limit}"
+        with self._single_flight(f"channel:{key}"):
+            cached = self._channel_cache.get(key)
+            if cached is None or time.monotonic() - cached[0] > self.CHANNEL_CACHE_TTL:
+                cached = (time.monotonic(), self._download_channel_videos(channel_id, limit))
+                self._channel_cache[key] = cached
+        # Callers annotate the video dicts in place, so hand out copies of the cached feed.
+        return [dict(video) for video in cached[1]]
+
+    @contextmanager
+    def _single_flight(self, key: str) -> Iterator[None]:
+        with self._flight_locks_lock:
+            lock = self._flight_locks.setdefault(key, threading.Lock())
+        with lock:
+            yield
+
+    def _download_channel_videos(self, channel_id: str, limit: int) -> List[dict]:
         rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
         print(f"  ⏳ Fetching RSS feed for channel {channel_id}")
         rss_response = None
@@ -196,30 +324,18 @@ class YouTubeIngestor:
         videos: List[dict] = []
         if rss_response is not None:
             try:
-                root = ElementTree.fromstring(rss_response.content)
-            except ElementTree.ParseError:
-                print(f"  ⚠️ Unable to parse RSS feed for channel {channel_id}")
-                root = None
-
-            if root is not None:
-                ns = {
-                    "atom": "http://www.w3.org/2005/Atom",
-                    "yt": "http://www.youtube.com/xml/schemas/2015",
-                }
-
-                for entry in root.findall("atom:entry", ns)[:limit]:
-                    video_id_elem = entry.find("yt:videoId", ns)
-                    title_elem = entry.find("atom:title", ns)
-                    published_elem = entry.find("atom:published", ns)
-                    author_elem = entry.find("atom:author/atom:name", ns)
-
-                    if not video_id_elem or not title_elem:
+                # Stream the feed and stop once enough entries are collected.
+                for _, element in ElementTree.iterparse(io.BytesIO(rss_response.content), events=("end",)):
+                    if element.tag != _ATOM_ENTRY:
                         continue
+                    video_id = element.findtext(_YT_VIDEO_ID)
+                    title = element.findtext(_ATOM_TITLE)
+                    published = element.findtext(_ATOM_PUBLISHED)
+                    channel_title = element.findtext(_ATOM_AUTHOR_NAME)
+                    element.clear()
 
-                    video_id = video_id_elem.text
-                    title = title_elem.text
-                    published = published_elem.text if published_elem is not None else None
-                    channel_title = author_elem.text if author_elem is not None else None
+                    if not video_id or not title:
+                        continue
 
                     videos.append(
                         {
@@ -231,6 +347,11 @@ class YouTubeIngestor:
                             "url": f"https://www.youtube.com/watch?v={video_id}",
                         }
                     )
+                    if len(videos) >= limit:
+                        break
+            except ElementTree.ParseError:
+                print(f"  ⚠️ Unable to parse RSS feed for channel {channel_id}")
+                videos = []
 
         if videos:
             print(f"  ✅ Retrieved {len(videos)} videos from RSS for channel {channel_id}")
@@ -250,25 +371,30 @@ class YouTubeIngestor:
             print(f"  ⚠️ Unable to fetch channel page for {channel_id}: {exc}")
             return []
 
-        match = re.search(r"ytInitialData\s*=\s*(\{.*?\})\s*;", response.text, re.DOTALL)
+        match = _YT_INITIAL_DATA_RE.search(response.text)
         if not match:
             print(f"  ⚠️ Could not locate ytInitialData for channel {channel_id}")
             return []
 
         try:
-            data = json.loads(match.group(1))
-        except json.JSONDecodeError as exc:
+            data = orjson.loads(match.group(1))
+        except orjson.JSONDecodeError as exc:
             print(f"  ⚠️ Failed to parse ytInitialData for channel {channel_id}: {exc}")
             return []
 
         videos: List[dict] = []
 
+        # One pass over the tabs: the selected tab's rich grid is read directly, while the
+        # first tab's section list is kept for the legacy layout fallback below.
+        section_list: dict = {}
         tabs = data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", [])
-        for tab in tabs:
-            tab_renderer = tab.get("tabRenderer")
-            if not tab_renderer or not tab_renderer.get("selected"):
-                continue
+        for tab_index, tab in enumerate(tabs):
+            tab_renderer = tab.get("tabRenderer") or {}
             content = tab_renderer.get("content", {})
+            if tab_index == 0:
+                section_list = content.get("sectionListRenderer", {})
+            if not tab_renderer.get("selected"):
+                continue
             rich_grid = content.get("richGridRenderer")
             if rich_grid:
                 for order_index, item in enumerate(rich_grid.get("contents", [])):
@@ -285,12 +411,6 @@ class YouTubeIngestor:
                     if len(videos) >= limit:
                         return videos
 
-        # Legacy layout fallback
-        tabs = data.get("contents", {}).get("twoColumnBrowseResultsRenderer", {}).get("tabs", [])
-        section_list = {}
-        if tabs:
-            tab_renderer = tabs[0].get("tabRenderer", {})
-            section_list = tab_renderer.get("content", {}).get("sectionListRenderer", {})
         for section in section_list.get("contents", []):
             item_section = section.get("itemSectionRenderer")
             if not item_section:
@@ -345,19 +465,16 @@ class YouTubeIngestor:
             print(f"  ⚠️ Unable to fetch metadata for {video_url}: {exc}")
             return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        title = soup.select_one("meta[name='title']")
-        title_text = title["content"] if title and title.has_attr("content") else soup.title.string if soup.title else video_id
-        channel = soup.select_one("link[itemprop='name']")
-        channel_name = channel["content"] if channel and channel.has_attr("content") else None
-        date_meta = soup.select_one("meta[itemprop='datePublished']")
-        published_at = date_meta["content"] if date_meta and date_meta.has_attr("content") else None
-        channel_id = None
-        channel_meta = soup.select_one("meta[itemprop='channelId']")
-        if channel_meta and channel_meta.has_attr("content"):
-            channel_id = channel_meta["content"]
-        else:
-            match = re.search(r'"channelId":"([A-Za-z0-9_-]{24})"', response.text)
+        tree = LexborHTMLParser(response.text)
+        title_text = _meta_content(tree, "meta[name='title']")
+        if title_text is None:
+            title_node = tree.css_first("title")
+            title_text = title_node.text() if title_node is not None else video_id
+        channel_name = _meta_content(tree, "link[itemprop='name']")
+        published_at = _meta_content(tree, "meta[itemprop='datePublished']")
+        channel_id = _meta_content(tree, "meta[itemprop='channelId']")
+        if channel_id is None:
+            match = _CHANNEL_ID_RE.search(response.text)
             if match:
                 channel_id = match.group(1)
         return {
@@ -372,23 +489,19 @@ class YouTubeIngestor:
     def _is_iso_date(self, value: Optional[str]) -> bool:
         if not value or not isinstance(value, str):
             return False
-        try:
-            datetime.fromisoformat(value.replace("Z", "+00:00"))
-            return True
-        except ValueError:
-            return False
+        return _parse_iso_datetime(value) is not None
 
     def _hydrate_published_at(self, video: dict) -> None:
         published_at = video.get("published_at")
         if not published_at or not isinstance(published_at, str):
             return
-        relative = self._parse_relative_published_at(published_at)
+        relative = self._parse_relative_published_at(published_at, now=self._ingest_now)
         if relative:
             video["published_at"] = relative
 
-    def _parse_relative_published_at(self, value: str) -> Optional[str]:
+    def _parse_relative_published_at(self, value: str, now: Optional[datetime] = None) -> Optional[str]:
         text = value.strip().lower()
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
 
         if text in {"just now", "moments ago"}:
             return now.isoformat()
@@ -397,7 +510,7 @@ class YouTubeIngestor:
         if text in {"yesterday"}:
             return (now - timedelta(days=1)).isoformat()
 
-        match = re.match(r"(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago", text)
+        match = _RELATIVE_TIME_RE.match(text)
         if not match:
             return None
         amount = int(match.group(1))
@@ -421,53 +534,49 @@ class YouTubeIngestor:
         return (now - delta).isoformat()
 
     def _extract_channel_id_local(self, url: str) -> Optional[str]:
-        if "channel/" in url:
-            parts = url.rstrip("/").split("/")
-            if parts:
-                last = parts[-1]
-                if last.startswith("UC") and len(last) == 24:
-                    return last
-        if url.startswith("UC") and len(url) == 24:
-            return url
-        return None
-
-    def _slugify(self, value: str) -> str:
-        return re.sub(r"[^a-z0-9]+", "", value.lower())
-
-    def _videos_from_store(self, entry: ReadingListEntry, channel_id: Optional[str], limit: int = 30) -> List[dict]:
-        handle = ""
-        if "@" in entry.url:
-            handle = entry.url.split("@", 1)[1].strip("/")
-        handle_slug = self._slugify(handle)
-        handle_base = re.sub(r"\d+$", "", handle_slug)
-        title_slug = self._slugify(entry.title or "")
-
-        candidates: List[dict] = []
-        for video in self.tracker.metadata.values():
+        match = _LOCAL_CHANNEL_ID_RE.fullmatch(url)
+        if not match:
+            return None
+        return match.group(1) or match.group(0)
+
+    def _index_store(self) -> None:
+        """Group tracker videos by channel id and channel-name slug, keeping their store order."""
+        videos = list(self.tracker.metadata.values())
+        by_channel_id: Dict[str, List[int]] = {}
+        by_name_slug: Dict[str, List[int]] = {}
+        for position, video in enumerate(videos):
             vid_channel_id = video.get("channel_id")
-            if channel_id and vid_channel_id == channel_id:
-                candidates.append(video)
-                continue
-            if handle_slug:
-                name = video.get("channel_name", "")
-                if name:
-                    name_slug = self._slugify(name)
-                    if (
-                        handle_slug in name_slug
-                        or name_slug in handle_slug
-                        or (handle_base and handle_base in name_slug)
-                        or (title_slug and title_slug in name_slug)
-                    ):
-                        candidates.append(video)
-                        continue
-            if title_slug:
-                name = video.get("channel_name", "")
-                if name and title_slug in self._slugify(name):
-                    candidates.append(video)
+            if vid_channel_id:
+                by_channel_id.setdefault(vid_channel_id, []).append(position)
+            name = video.get("channel_name", "")
+            if name:
+                by_name_slug.setdefault(_slugify(name), []).append(position)
+        self._store_index = (videos, by_channel_id, by_name_slug)
+        self._store_matches = {}
+
+    def _match_store_videos(
+        self, channel_id: Optional[str], handle_slug: str, handle_base: str, title_slug: str
+    ) -> List[dict]:
+        if self._store_index is None:
+            self._index_store()
+        videos, by_channel_id, by_name_slug = self._store_index
+
+        positions = set(by_channel_id.get(channel_id, ())) if channel_id else set()
+        for name_slug, name_positions in by_name_slug.items():
+            if (
+                handle_slug
+                and (
+                    handle_slug in name_slug
+                    or name_slug in handle_slug
+                    or (handle_base and handle_base in name_slug)
+                )
+            ) or (title_slug and title_slug in name_slug):
+                positions.update(name_positions)
 
         seen = set()
         unique = []
-        for video in candidates:
+        for position in sorted(positions):
+            video = videos[position]
             vid = video.get("video_id")
             if vid and vid in seen:
                 continue
@@ -475,8 +584,24 @@ class YouTubeIngestor:
             unique.append(video)
 
         unique.sort(key=lambda item: item.get("published_date", ""), reverse=True)
+        return unique
+
+    def _videos_from_store(self, entry: ReadingListEntry, channel_id: Optional[str], limit: int = 30) -> List[dict]:
+        handle = ""
+        if "@" in entry.url:
+            handle = entry.url.split("@", 1)[1].strip("/")
+        handle_slug = _slugify(handle)
+        handle_base = _TRAILING_DIGITS_RE.sub("", handle_slug)
+        title_slug = _slugify(entry.title or "")
+
+        key = (channel_id, handle_slug, title_slug, limit)
+        matches = self._store_matches.get(key)
+        if matches is None:
+            matches = self._match_store_videos(channel_id, handle_slug, handle_base, title_slug)[:limit]
+            self._store_matches[key] = matches
+
         result = []
-        for video in unique[:limit]:
+        for video in matches:
             result.append(
                 {
                     "video_id": video.get("video_id"),
@@ -508,12 +633,7 @@ class YouTubeIngestor:
                 combined[vid] = collection
         def sort_key(item: dict) -> tuple:
             published = item.get("published_at") or item.get("published_date")
-            iso_value = None
-            if isinstance(published, str):
-                try:
-                    iso_value = datetime.fromisoformat(published.replace("Z", "+00:00"))
-                except ValueError:
-                    iso_value = None
+            iso_value = _parse_iso_datetime(published) if isinstance(published, str) else None
             order_index = item.get("order_index", 0)
             if iso_value is not None:
                 return (0, iso_value, -order_index)
@@ -538,24 +658,39 @@ class YouTubeIngestor:
             "duration_seconds": video.get("duration_seconds"),
         }
 
-    def _load_transcript(self, video: dict) -> tuple[Optional[str], Optional[str]]:
+    def _transcript_paths(self, video: dict) -> List[str]:
         transcript_paths = []
         explicit = video.get("transcript_file")
         if explicit:
             transcript_paths.append(explicit)
         video_id = video.get("video_id")
         if video_id:
-            transcript_paths.append(self.tracker.transcripts_dir + f"/{video_id}.txt")
+            transcript_paths.append(os.path.join(self.tracker.transcripts_dir, f"{video_id}.txt"))
+        return transcript_paths
+
+    def _transcript_stamp(self, video: dict) -> Optional[list]:
+        """Return the [path, mtime_ns, size] stamp _load_transcript would record, without reading the file."""
+        for path in self._transcript_paths(video):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            return [path, stat.st_mtime_ns, stat.st_size]
+        return None
+
+    def _load_transcript(self, video: dict) -> tuple[Optional[str], Optional[str], Optional[list]]:
+        transcript_paths = self._transcript_paths(video)
 
+        # Open directly instead of probing with exists() first; a missing file costs one failed open.
         for path in transcript_paths:
-            if path and os.path.exists(path):
-                try:
-                    with open(path, "r", encoding="utf-8") as handle:
-                        return handle.read(), None
-                except OSError:
-                    continue
+            try:
+                with open(path, "r", encoding="utf-8") as handle:
+                    stat = os.fstat(handle.fileno())
+                    return handle.read(), None, [path, stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                continue
 
-        return None, "Transcript not downloaded. Fetch one at a time before summarizing."
+        return None, "Transcript not downloaded. Fetch one at a time before summarizing.", None
 
 
 __all__ = ["YouTubeIngestor", "YouTubeContent"]
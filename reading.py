@@ -1,48 +1,255 @@
 #!/usr/bin/env python3
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from datetime import datetime
 import os
 import sys
 from urllib.parse import urljoin, urlparse
 import time
 import json
+import orjson
 import hashlib
 import subprocess
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pipeline.urls import join_url
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 try:
     import dateutil.parser
 except ImportError:
     print("Warning: python-dateutil not installed. Date parsing may be limited.")
     dateutil = None
 
+_ORG_LINK_RE = re.compile(r'\[\[([^]]+)\]\[[^]]*\]\]')
+_MD_LINK_RE = re.compile(r'\[([^]]*)\]\(([^)]+)\)')
+_PLAIN_URL_RE = re.compile(r'https?://[^\s\]\)]+(?:\.[^\s\]\)]+)*/?')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_WS_RE = re.compile(r'\s+')
+# January 15, 2024 | 2024-01-15 | 1/15/2024, scanned in a single pass
+_DATE_TEXT_RE = re.compile(r'\w+ \d{1,2}, \d{4}|\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}')
+MAX_ARTICLE_BYTES = 2_000_000
+# Applied one after another, in this order
+_BOILERPLATE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'Subscribe.*?Newsletter',
+        r'Follow.*?Twitter',
+        r'Share.*?Facebook',
+        r'Comments.*?below',
+        r'Originally published.*?\d{4}',
+        r'Read more.*?here',
+        r'Click here.*?experience',
+    )
+]
+
+# Obvious non-content links
+_SKIP_LINK_PATTERNS = [
+    'about', 'contact', 'privacy', 'terms', 'subscribe', 'login', 'register',
+    'search', 'tag', 'category', 'archive', 'rss', 'feed', 'xml',
+    'twitter', 'facebook', 'linkedin', 'instagram', 'youtube',
+    'mailto:', 'tel:', '#', 'javascript:', 'share', 'comment',
+    '.pdf', '.jpg', '.png', '.gif', '.svg', '.css', '.js'
+]
+_SKIP_LINK_RE = re.compile('|'.join(map(re.escape, _SKIP_LINK_PATTERNS)))
+# Positive signals for content
+_CONTENT_SIGNALS = [
+    # URL patterns
+    '/20', '/19',  # Years in URL (common in blog posts)
+    '-', '_',      # Dashes/underscores often in post URLs
+
+    # Title signals
+    'how to', 'why', 'what', 'when', 'where', 'guide', 'tips',
+    'analysis', 'review', 'insights', 'lessons', 'thoughts',
+    'introduction', 'understanding', 'explaining', 'deep dive',
+    'case study', 'framework', 'strategy', 'approach'
+]
+_PARAGRAPH_SKIP_WORDS = ['subscribe', 'follow', 'share', 'comment', 'navigation', 'menu', 'copyright']
+_IMPORTANCE_WORDS = [
+    'however', 'therefore', 'because', 'shows', 'demonstrates', 'reveals',
+    'suggests', 'argues', 'important', 'key', 'main', 'primary', 'central',
+    'problem', 'solution', 'approach', 'method', 'strategy', 'insight',
+    'research', 'study', 'analysis', 'finding', 'result', 'conclusion'
+]
+_AVOID_WORDS = [
+    'subscribe', 'follow', 'share', 'click', 'link', 'newsletter',
+    'twitter', 'facebook', 'comment', 'below', 'above', 'here'
+]
+_THEME_KEYWORDS = {
+    'business strategy': ['business', 'strategy', 'startup', 'entrepreneur', 'growth', 'market', 'revenue', 'company', 'competitive', 'industry'],
+    'psychology': ['psychology', 'behavior', 'mental', 'mind', 'cognitive', 'brain', 'emotion', 'human', 'thinking', 'perception'],
+    'technology': ['technology', 'tech', 'software', 'ai', 'artificial intelligence', 'digital', 'internet', 'data', 'algorithm', 'computer'],
+    'productivity': ['productivity', 'efficiency', 'time', 'habits', 'systems', 'workflow', 'organization', 'focus', 'performance'],
+    'finance': ['investing', 'finance', 'money', 'wealth', 'economics', 'financial', 'investment', 'capital', 'income', 'profit'],
+    'leadership': ['leadership', 'management', 'team', 'culture', 'organization', 'people', 'communication', 'influence', 'management'],
+    'creativity': ['creativity', 'innovation', 'design', 'thinking', 'creative', 'art', 'ideas', 'imagination', 'innovation'],
+    'writing': ['writing', 'content', 'storytelling', 'communication', 'words', 'language', 'narrative', 'author', 'publish'],
+    'personal development': ['development', 'improvement', 'growth', 'learning', 'skills', 'habits', 'mindset', 'success', 'goals']
+}
+
+# Blog post/article link selectors, tried in order of specificity
+_POST_LINK_SELECTORS = [
+    sv.compile(selector)
+    for selector in (
+        # Direct article links
+        'article h1 a, article h2 a, article h3 a, article .title a',
+        '.post-title a, .entry-title a, .post-link a',
+        '.article-title a, .blog-title a, .story-title a',
+
+        # Content area headings
+        'main h1 a, main h2 a, main h3 a',
+        '.content h1 a, .content h2 a, .content h3 a',
+        '.posts h1 a, .posts h2 a, .posts h3 a',
+
+        # Common blog structures
+        '.post h1 a, .post h2 a, .entry h1 a, .entry h2 a',
+        '.blog-post a, .article a, .story a',
+
+        # Newsletter/feed structures
+        '.newsletter-item a, .feed-item a, .post-item a',
+
+        # General heading links (broader search)
+        'h1 a, h2 a, h3 a',
+    )
+]
+_DATE_SELECTORS = [
+    sv.compile(selector)
+    for selector in (
+        'time[datetime]', 'time[pubdate]', '.date', '.published', '.post-date',
+        '.entry-date', '.article-date', '[datetime]', '.timestamp', '.pub-date',
+    )
+]
+# Unwanted elements stripped before extracting article text
+_DATE_HEADER_SELECTOR = sv.compile('article header, .post-header, .entry-header, main header')
+_UNWANTED_SELECTOR = sv.compile(
+    'script, style, nav, header, footer, aside, .sidebar, .navigation, .menu, '
+    '.comments, .related, .share, .tags'
+)
+# Main article content, tried in order
+_CONTENT_SELECTORS = [
+    sv.compile(selector)
+    for selector in (
+        'article .content, article .post-content, article .entry-content',
+        '.post-content, .entry-content, .article-content',
+        'article p, .content p, main p',
+        'article', '.post', '.entry', 'main',
+    )
+]
+
+@lru_cache(maxsize=4096)
+def format_post_date(value):
+    """Parse a date string and format it for the report; cached per distinct string"""
+    # Most <time datetime> values are ISO 8601 (YYYY-MM-DD...), which fromisoformat handles in C
+    if value[4:5] == '-' and value[7:8] == '-':
+        try:
+            return datetime.fromisoformat(value).strftime('%B %d, %Y')
+        except ValueError:
+            pass
+    if not dateutil:
+        raise ValueError(f"Cannot parse date without python-dateutil: {value}")
+    return dateutil.parser.parse(value).strftime('%B %d, %Y')
+
+@lru_cache(maxsize=1024)
+def site_domain(url):
+    """Lowercased host of a URL with 'www.' removed, for same-site comparisons"""
+    return urlparse(url).netloc.lower().replace('www.', '')
+
 class NewsletterAnalyzer:
     def __init__(self):
         self.session = requests.Session()
+        # Size the pool for the concurrent fetches so each host's keep-alive connections get reused
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
         self.cache_file = "/Users/haixun/projects/0 Life/Reading/.processed_posts.json"
         self.processed_posts = self.load_cache()
+        # Parsed newsletter index pages with their ETag/Last-Modified, revalidated with conditional GETs
+        self.index_cache_file = "/Users/haixun/projects/0 Life/Reading/.index_pages.json"
+        self.index_pages = self.load_cache(self.index_cache_file)
+        self.cache_lock = threading.Lock()
+        # Politeness is per host: at most 2 requests in flight and 0.5s between request starts
+        self.host_semaphores = defaultdict(lambda: threading.Semaphore(2))
+        self.host_next_request = {}
+        self.host_lock = threading.Lock()
+    
+    def get(self, url, headers=None, stream=False):
+        """GET a URL while respecting the per-host concurrency and interval limits"""
+        host = urlparse(url).netloc.lower()
+        with self.host_lock:
+            semaphore = self.host_semaphores[host]
+        with semaphore:
+            with self.host_lock:
+                now = time.monotonic()
+                start = max(now, self.host_next_request.get(host, 0))
+                self.host_next_request[host] = start + 0.5
+            if start > now:
+                time.sleep(start - now)
+            # Separate connect/read timeouts so a slow handshake doesn't eat the read budget
+            return self.session.get(url, timeout=(3, 10), headers=headers, stream=stream)
     
-    def load_cache(self):
-        """Load previously processed posts from cache"""
+    def make_soup(self, response, content=None):
+        """Parse a response (or its already-read body) with lxml when available; lxml detects the encoding from the raw bytes"""
+        if HTML_PARSER == 'lxml':
+            return BeautifulSoup(response.content if content is None else content, HTML_PARSER)
+        if content is None:
+            return BeautifulSoup(response.text, HTML_PARSER)
+        return BeautifulSoup(content, HTML_PARSER, from_encoding=response.encoding)
+    
+    def read_capped(self, response):
+        """Read a streamed response body, stopping once MAX_ARTICLE_BYTES have arrived"""
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(64 * 1024):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_ARTICLE_BYTES:
+                break
+        return b''.join(chunks)
+    
+    def load_cache(self, cache_file=None):
+        """Load previously processed posts (or another JSON cache file) from cache"""
+        cache_file = cache_file or self.cache_file
         try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            if os.path.exists(cache_file):
+                with open(cache_file, 'rb') as f:
+                    raw = f.read()
+                try:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # Caches written by older json.dump runs may hold NaN or lone surrogates orjson rejects
+                    return json.loads(raw)
         except Exception as e:
             print(f"Warning: Could not load cache: {e}")
         return {}
     
     def save_cache(self):
-        """Save processed posts to cache"""
-        try:
-            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.processed_posts, f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not save cache: {e}")
+        """Save processed posts and index page validators to cache"""
+        for cache_file, data in ((self.cache_file, self.processed_posts), (self.index_cache_file, self.index_pages)):
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                # Write beside the cache and rename so an interrupted run never leaves a truncated file
+                tmp_file = cache_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(data))
+                os.replace(tmp_file, cache_file)
+            except Exception as e:
+                print(f"Warning: Could not save cache: {e}")
     
     def get_post_hash(self, url):
         """Generate a hash for a post URL"""
@@ -50,19 +257,11 @@ class NewsletterAnalyzer:
     
     def is_likely_content_link(self, href, title, full_url, base_url):
         """Intelligently determine if a link is likely to be content/post"""
-        href_lower = href.lower()
-        title_lower = title.lower()
+        # Scan href and title together; no pattern contains NUL, so matches can't span the two
+        link_text = href.lower() + '\x00' + title.lower()
         
         # Skip obvious non-content links
-        skip_patterns = [
-            'about', 'contact', 'privacy', 'terms', 'subscribe', 'login', 'register',
-            'search', 'tag', 'category', 'archive', 'rss', 'feed', 'xml',
-            'twitter', 'facebook', 'linkedin', 'instagram', 'youtube',
-            'mailto:', 'tel:', '#', 'javascript:', 'share', 'comment',
-            '.pdf', '.jpg', '.png', '.gif', '.svg', '.css', '.js'
-        ]
-        
-        if any(pattern in href_lower or pattern in title_lower for pattern in skip_patterns):
+        if _SKIP_LINK_RE.search(link_text):
             return False
         
         # Skip if it's just a domain or very short path
@@ -73,33 +272,13 @@ class NewsletterAnalyzer:
         if not href.startswith(('/', '#')):
             # Allow same domain links (e.g., blog.site.com vs site.com/letters)
             try:
-                base_domain = urlparse(base_url).netloc.lower()
-                href_domain = urlparse(full_url).netloc.lower()
-                
-                # Remove 'www.' prefix for comparison
-                base_domain = base_domain.replace('www.', '')
-                href_domain = href_domain.replace('www.', '')
-                
-                if base_domain != href_domain:
+                if site_domain(base_url) != site_domain(full_url):
                     return False
             except:
                 return False
         
-        # Positive signals for content
-        content_signals = [
-            # URL patterns
-            '/20', '/19',  # Years in URL (common in blog posts)
-            '-', '_',      # Dashes/underscores often in post URLs
-            
-            # Title signals  
-            'how to', 'why', 'what', 'when', 'where', 'guide', 'tips',
-            'analysis', 'review', 'insights', 'lessons', 'thoughts',
-            'introduction', 'understanding', 'explaining', 'deep dive',
-            'case study', 'framework', 'strategy', 'approach'
-        ]
-        
         # Check for content signals
-        signal_count = sum(1 for signal in content_signals if signal in href_lower or signal in title_lower)
+        signal_count = sum(1 for signal in _CONTENT_SIGNALS if signal in link_text)
         
         # URL structure analysis
         path_parts = [part for part in href.split('/') if part]
@@ -119,62 +298,67 @@ class NewsletterAnalyzer:
         
         return score > 0.3  # Threshold for considering it content
 
-    def extract_urls_from_readinglist(self, file_path):
-        """Extract URLs from the readinglist.md file"""
+    def extract_urls_from_readinglist(self, file_path, dedup_by='url', max_per_domain=1):
+        """Extract URLs from the readinglist.md file
+        
+        Every distinct URL is kept by default, so several posts on one site are all analyzed.
+        Pass dedup_by='domain' to keep at most max_per_domain URLs per domain instead.
+        """
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Extract URLs from both org-mode links [[URL][title]] and plain URLs
-        # First try org-mode links
-        org_links = re.findall(r'\[\[([^]]+)\]\[[^]]*\]\]', content)
-        
-        # Then try markdown links
-        markdown_links = re.findall(r'\[([^]]*)\]\(([^)]+)\)', content)
-        
-        # Also find plain URLs
-        plain_urls = re.findall(r'https?://[^\s\]\)]+(?:\.[^\s\]\)]+)*/?', content)
+        # Extract URLs from org-mode links [[URL][title]], markdown links and plain URLs
+        all_urls = _ORG_LINK_RE.findall(content)
+        all_urls.extend(url for _, url in _MD_LINK_RE.findall(content))
+        all_urls.extend(_PLAIN_URL_RE.findall(content))
         
-        # Combine all URLs
-        all_urls = []
-        all_urls.extend(org_links)  # org-mode URLs
-        all_urls.extend([url for _, url in markdown_links])  # markdown URLs
-        all_urls.extend(plain_urls)  # plain URLs
-        
-        # Clean up URLs and deduplicate more aggressively
+        # Clean up URLs and deduplicate in one pass
         clean_urls = []
-        seen_domains = set()
+        seen_urls = set()
+        domain_counts = defaultdict(int)
         
         for url in all_urls:
             # Clean URL
             clean_url = url.rstrip('.,;:!?').strip()
             
-            if not clean_url.startswith('http'):
+            # The same link usually matches both a link pattern and the plain URL pattern
+            if not clean_url.startswith('http') or clean_url in seen_urls:
                 continue
+            seen_urls.add(clean_url)
             
-            # Extract domain for better deduplication
-            try:
-                parsed = urlparse(clean_url)
-                domain = parsed.netloc.lower()
+            if dedup_by == 'domain':
+                try:
+                    domain = urlparse(clean_url).netloc.lower()
+                except ValueError:
+                    # If URL parsing fails, skip it
+                    continue
                 
-                # Skip if we've seen this domain before
-                if domain in seen_domains:
+                # Skip once this domain has used up its share
+                if domain_counts[domain] >= max_per_domain:
                     continue
-                    
-                clean_urls.append(clean_url)
-                seen_domains.add(domain)
-            except:
-                # If URL parsing fails, skip it
-                continue
+                domain_counts[domain] += 1
+            
+            clean_urls.append(clean_url)
         
         return clean_urls
     
     def fetch_recent_posts(self, base_url):
         """Fetch recent posts from a newsletter/blog URL"""
         try:
-            response = self.session.get(base_url, timeout=10)
+            with self.cache_lock:
+                cached = self.index_pages.get(base_url)
+            headers = {}
+            if cached and cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached and cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+            
+            response = self.get(base_url, headers=headers or None)
+            if response.status_code == 304 and cached:
+                return cached['result']
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self.make_soup(response)
             
             # Extract site title
             site_title = soup.find('title')
@@ -182,37 +366,18 @@ class NewsletterAnalyzer:
             
             # Look for article links and titles
             articles = []
+            parsed_base = urlparse(base_url)
+            root = f"{parsed_base.scheme}://{parsed_base.netloc}"
             
             # Enhanced selectors for blog posts/articles
-            selectors = [
-                # Direct article links
-                'article h1 a, article h2 a, article h3 a, article .title a',
-                '.post-title a, .entry-title a, .post-link a',
-                '.article-title a, .blog-title a, .story-title a',
-                
-                # Content area headings
-                'main h1 a, main h2 a, main h3 a',
-                '.content h1 a, .content h2 a, .content h3 a',
-                '.posts h1 a, .posts h2 a, .posts h3 a',
-                
-                # Common blog structures
-                '.post h1 a, .post h2 a, .entry h1 a, .entry h2 a',
-                '.blog-post a, .article a, .story a',
-                
-                # Newsletter/feed structures
-                '.newsletter-item a, .feed-item a, .post-item a',
-                
-                # General heading links (broader search)
-                'h1 a, h2 a, h3 a'
-            ]
-            
-            for selector in selectors:
-                links = soup.select(selector)
-                for link in links[:8]:  # Get up to 8 recent posts
+            for selector in _POST_LINK_SELECTORS:
+                # limit stops the match as soon as 8 links are found instead of walking the whole page
+                links = selector.select(soup, limit=8)
+                for link in links:  # Get up to 8 recent posts
                     href = link.get('href')
                     title = link.get_text(strip=True)
                     if href and title and len(title) > 5:  # Reduced from 10 to 5
-                        full_url = urljoin(base_url, href)
+                        full_url = join_url(base_url, root, href)
                         # Use intelligent filtering
                         if self.is_likely_content_link(href, title, full_url, base_url):
                             articles.append({'title': title, 'url': full_url})
@@ -222,12 +387,12 @@ class NewsletterAnalyzer:
             
             # If no articles found with selectors, intelligently analyze all links
             if not articles:
-                all_links = soup.find_all('a', href=True)
-                for link in all_links[:50]:  # Increased from 20 to 50
+                all_links = soup.find_all('a', href=True, limit=50)
+                for link in all_links:  # Increased from 20 to 50
                     href = link['href']
                     title = link.get_text(strip=True)
                     if href and title and len(title) > 10:
-                        full_url = urljoin(base_url, href)
+                        full_url = join_url(base_url, root, href)
                         
                         # Intelligent filtering - look for content-like characteristics
                         if self.is_likely_content_link(href, title, full_url, base_url):
@@ -245,13 +410,23 @@ class NewsletterAnalyzer:
                     if len(unique_articles) >= 5:  # Increased from 3 to 5
                         break
 
-            return {
+            result = {
                 'site_title': site_title,
                 'base_url': base_url,
                 'articles': unique_articles,
                 'success': True
             }
             
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            with self.cache_lock:
+                if etag or last_modified:
+                    self.index_pages[base_url] = {'etag': etag, 'last_modified': last_modified, 'result': result}
+                else:
+                    self.index_pages.pop(base_url, None)
+            
+            return result
+            
         except Exception as e:
             return {
                 'site_title': urlparse(base_url).netloc,
@@ -263,22 +438,15 @@ class NewsletterAnalyzer:
     
     def extract_post_date(self, soup):
         """Extract post publication date from HTML"""
-        date_selectors = [
-            'time[datetime]', 'time[pubdate]', '.date', '.published', '.post-date',
-            '.entry-date', '.article-date', '[datetime]', '.timestamp', '.pub-date'
-        ]
-        
-        for selector in date_selectors:
-            date_elem = soup.select_one(selector)
+        for selector in _DATE_SELECTORS:
+            date_elem = selector.select_one(soup)
             if date_elem:
                 # Try datetime attribute first
                 date_attr = date_elem.get('datetime') or date_elem.get('pubdate')
                 if date_attr:
                     try:
                         # Parse various date formats
-                        if dateutil:
-                            parsed_date = dateutil.parser.parse(date_attr)
-                            return parsed_date.strftime('%B %d, %Y')
+                        return format_post_date(date_attr)
                     except:
                         pass
                 
@@ -286,60 +454,72 @@ class NewsletterAnalyzer:
                 date_text = date_elem.get_text().strip()
                 if date_text:
                     try:
-                        if dateutil:
-                            parsed_date = dateutil.parser.parse(date_text)
-                            return parsed_date.strftime('%B %d, %Y')
+                        return format_post_date(date_text)
                     except:
                         pass
         
-        # Look for date patterns in text
-        date_patterns = [
-            r'(\w+ \d{1,2}, \d{4})',  # January 15, 2024
-            r'(\d{4}-\d{2}-\d{2})',   # 2024-01-15
-            r'(\d{1,2}/\d{1,2}/\d{4})'  # 1/15/2024
-        ]
-        
-        page_text = soup.get_text()
-        for pattern in date_patterns:
-            matches = re.findall(pattern, page_text)
-            if matches:
-                try:
-                    if dateutil:
-                        parsed_date = dateutil.parser.parse(matches[0])
-                        return parsed_date.strftime('%B %d, %Y')
-                except:
-                    continue
-        
+        # Look for date patterns in the post header, or the first ~4KB of page text, before the whole document
+        header = _DATE_HEADER_SELECTOR.select_one(soup)
+        if header:
+            head_text = header.get_text(' ', strip=True)
+            covers_page = False
+        else:
+            # Walk text nodes only until 4KB is collected rather than joining the whole page
+            parts = []
+            size = 0
+            covers_page = True
+            for text in soup.stripped_strings:
+                parts.append(text)
+                size += len(text) + 1
+                if size >= 4096:
+                    covers_page = False
+                    break
+            head_text = ' '.join(parts)
+        post_date = self.find_date_in_text(head_text)
+        if post_date is None and not covers_page:
+            post_date = self.find_date_in_text(soup.get_text())
+        return post_date
+    
+    def find_date_in_text(self, text):
+        """Return the first date-looking string in text that parses, or None"""
+        for match in _DATE_TEXT_RE.finditer(text):
+            try:
+                return format_post_date(match.group())
+            except:
+                continue
         return None
 
     def analyze_content(self, article_url):
         """Fetch and analyze content from an article URL"""
         try:
-            response = self.session.get(article_url, timeout=10)
-            response.raise_for_status()
+            # Some "articles" are multi-MB pages with inline images; only the first MAX_ARTICLE_BYTES are parsed
+            with self.get(article_url, stream=True) as response:
+                response.raise_for_status()
+                content = self.read_capped(response)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = self.make_soup(response, content)
             
             # Extract post date
             post_date = self.extract_post_date(soup)
             
             # Remove unwanted elements
-            for element in soup(["script", "style", "nav", "header", "footer", 
-                                "aside", ".sidebar", ".navigation", ".menu", 
-                                ".comments", ".related", ".share", ".tags"]):
+            for element in _UNWANTED_SELECTOR.select(soup):
                 element.decompose()
             
-            # Try to find the main article content
-            content_selectors = [
-                'article .content, article .post-content, article .entry-content',
-                '.post-content, .entry-content, .article-content',
-                'article p, .content p, main p',
-                'article', '.post', '.entry', 'main'
-            ]
+            # Selectors overlap (article/.post/.entry/main), so the same <p> can be visited several
+            # times; extract and strip each paragraph's text only once
+            paragraph_texts = {}
+            
+            def paragraph_text(p):
+                key = id(p)
+                if key not in paragraph_texts:
+                    paragraph_texts[key] = p.get_text().strip()
+                return paragraph_texts[key]
             
+            # Try to find the main article content
             content_text = ""
-            for selector in content_selectors:
-                elements = soup.select(selector)
+            for selector in _CONTENT_SELECTORS:
+                elements = selector.select(soup)
                 if elements:
                     # Get text from paragraphs specifically
                     paragraphs = []
@@ -348,7 +528,7 @@ class NewsletterAnalyzer:
                         ps = elem.find_all('p')
                         if ps:
                             for p in ps:
-                                text = p.get_text().strip()
+                                text = paragraph_text(p)
                                 if len(text) > 30:  # Skip very short paragraphs
                                     paragraphs.append(text)
                     
@@ -361,9 +541,11 @@ class NewsletterAnalyzer:
                 paragraphs = soup.find_all('p')
                 content_paragraphs = []
                 for p in paragraphs:
-                    text = p.get_text().strip()
-                    if (len(text) > 50 and 
-                        not any(skip in text.lower() for skip in ['subscribe', 'follow', 'share', 'comment', 'navigation', 'menu', 'copyright'])):
+                    text = paragraph_text(p)
+                    if len(text) <= 50:
+                        continue
+                    text_lower = text.lower()
+                    if not any(skip in text_lower for skip in _PARAGRAPH_SKIP_WORDS):
                         content_paragraphs.append(text)
                 
                 content_text = ' '.join(content_paragraphs)
@@ -371,21 +553,11 @@ class NewsletterAnalyzer:
             # Clean up the text
             if content_text:
                 # Remove extra whitespace
-                content_text = ' '.join(content_text.split())
+                content_text = _WS_RE.sub(' ', content_text).strip()
                 
                 # Remove common boilerplate patterns
-                patterns_to_remove = [
-                    r'Subscribe.*?Newsletter',
-                    r'Follow.*?Twitter',
-                    r'Share.*?Facebook',
-                    r'Comments.*?below',
-                    r'Originally published.*?\d{4}',
-                    r'Read more.*?here',
-                    r'Click here.*?experience'
-                ]
-                
-                for pattern in patterns_to_remove:
-                    content_text = re.sub(pattern, '', content_text, flags=re.IGNORECASE)
+                for pattern in _BOILERPLATE_PATTERNS:
+                    content_text = pattern.sub('', content_text)
                 
                 # Limit content length for analysis
                 content_text = content_text[:3000]  # Increased for better summarization
@@ -404,18 +576,18 @@ class NewsletterAnalyzer:
     def create_proper_summary(self, content):
         """Create a proper summary from article content"""
         if "Could not fetch content:" in content or content == "No substantial content found":
-            return None, []
+            return None
         
         # Clean and prepare content
         content = content.strip()
         if not content:
-            return None, []
+            return None
         
         # Split into sentences
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if len(s.strip()) > 20]
+        sentences = [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(content)) if len(s) > 20]
         
         if not sentences:
-            return None, []
+            return None
         
         # Score sentences based on importance indicators
         scored_sentences = []
@@ -434,33 +606,21 @@ class NewsletterAnalyzer:
                 score -= 2
             
             # Content quality indicators
-            importance_words = [
-                'however', 'therefore', 'because', 'shows', 'demonstrates', 'reveals', 
-                'suggests', 'argues', 'important', 'key', 'main', 'primary', 'central',
-                'problem', 'solution', 'approach', 'method', 'strategy', 'insight',
-                'research', 'study', 'analysis', 'finding', 'result', 'conclusion'
-            ]
-            
-            for word in importance_words:
+            for word in _IMPORTANCE_WORDS:
                 if word in sentence_lower:
                     score += 3
             
             # Avoid promotional/boilerplate content
-            avoid_words = [
-                'subscribe', 'follow', 'share', 'click', 'link', 'newsletter', 
-                'twitter', 'facebook', 'comment', 'below', 'above', 'here'
-            ]
-            
-            for word in avoid_words:
+            for word in _AVOID_WORDS:
                 if word in sentence_lower:
                     score -= 5
             
             # Avoid sentences that seem like fragments or references
             if (sentence.startswith(('to ', 'and ', 'or ', 'but ', 'so ')) or 
-                len([c for c in sentence if c.isupper()]) > len(sentence) * 0.3):
+                sum(map(str.isupper, sentence)) > len(sentence) * 0.3):
                 score -= 3
             
-            scored_sentences.append((sentence, score))
+            scored_sentences.append((sentence, score, word_count))
         
         # Sort by score and take top sentences
         scored_sentences.sort(key=lambda x: x[1], reverse=True)
@@ -470,9 +630,8 @@ class NewsletterAnalyzer:
         total_words = 0
         target_words = 80  # Target summary length
         
-        for sentence, score in scored_sentences:
+        for sentence, score, word_count in scored_sentences:
             if score > 0:  # Only include sentences with positive scores
-                word_count = len(sentence.split())
                 if total_words + word_count <= target_words + 20:  # Allow some flexibility
                     selected_sentences.append(sentence)
                     total_words += word_count
@@ -500,19 +659,7 @@ class NewsletterAnalyzer:
         content_lower = content.lower()
         topics = []
         
-        theme_keywords = {
-            'business strategy': ['business', 'strategy', 'startup', 'entrepreneur', 'growth', 'market', 'revenue', 'company', 'competitive', 'industry'],
-            'psychology': ['psychology', 'behavior', 'mental', 'mind', 'cognitive', 'brain', 'emotion', 'human', 'thinking', 'perception'],
-            'technology': ['technology', 'tech', 'software', 'ai', 'artificial intelligence', 'digital', 'internet', 'data', 'algorithm', 'computer'],
-            'productivity': ['productivity', 'efficiency', 'time', 'habits', 'systems', 'workflow', 'organization', 'focus', 'performance'],
-            'finance': ['investing', 'finance', 'money', 'wealth', 'economics', 'financial', 'investment', 'capital', 'income', 'profit'],
-            'leadership': ['leadership', 'management', 'team', 'culture', 'organization', 'people', 'communication', 'influence', 'management'],
-            'creativity': ['creativity', 'innovation', 'design', 'thinking', 'creative', 'art', 'ideas', 'imagination', 'innovation'],
-            'writing': ['writing', 'content', 'storytelling', 'communication', 'words', 'language', 'narrative', 'author', 'publish'],
-            'personal development': ['development', 'improvement', 'growth', 'learning', 'skills', 'habits', 'mindset', 'success', 'goals']
-        }
-        
-        for theme, keywords in theme_keywords.items():
+        for theme, keywords in _THEME_KEYWORDS.items():
             keyword_count = sum(1 for keyword in keywords if keyword in content_lower)
             if keyword_count >= 2:  # Require at least 2 matching keywords
                 topics.append(theme)
@@ -537,66 +684,79 @@ class NewsletterAnalyzer:
         topics = self.detect_topics(content)
         
         # Build the final summary
-        summary = f"**[{article_title}]({article_url})**"
+        parts = [f"**[{article_title}]({article_url})**"]
         
         # Add date if available
         if post_date:
-            summary += f"\n\n*Published: {post_date}*"
-        
-        summary += "\n\n"
+            parts.append(f"\n\n*Published: {post_date}*")
         
-        if summary_text:
-            summary += summary_text
-        else:
-            summary += "Content could not be properly summarized."
+        parts.append("\n\n")
+        parts.append(summary_text or "Content could not be properly summarized.")
         
         # Add topics
         if topics:
-            summary += f"\n\n*Topics: {', '.join(topics)}*"
+            parts.append(f"\n\n*Topics: {', '.join(topics)}*")
         
-        summary += "\n\n---\n\n"
-        return summary
+        parts.append("\n\n---\n\n")
+        return ''.join(parts)
     
-    def generate_newsletter_summary(self, newsletter_data):
-        """Generate summaries for all posts from a newsletter"""
+    def generate_newsletter_summary(self, newsletter_data, article_executor=None):
+        """Generate summaries for all posts from a newsletter
+        
+        New posts are fetched on article_executor when one is given (main shares a single pool
+        across every newsletter); otherwise they are fetched one after another.
+        """
         if not newsletter_data['success'] or not newsletter_data['articles']:
             return f"## {newsletter_data['site_title']}\n\nUnable to fetch recent content from [{newsletter_data['base_url']}]({newsletter_data['base_url']})\n\n---\n\n"
         
         site_title = newsletter_data['site_title']
         base_url = newsletter_data['base_url']
         
-        summary = f"## {site_title}\n\n*Source: [{base_url}]({base_url})*\n\n"
+        parts = [f"## {site_title}\n\n*Source: [{base_url}]({base_url})*\n\n"]
         
         new_posts_count = 0
         cached_posts_count = 0
         
-        # Generate individual post summaries
+        # Split articles into cached summaries and ones that still need fetching
+        post_summaries = []
+        pending = []
         for article in newsletter_data['articles']:
             article_hash = self.get_post_hash(article['url'])
             
             # Check if we've already processed this post
-            if article_hash in self.processed_posts:
+            with self.cache_lock:
+                cached_summary = self.processed_posts.get(article_hash)
+            if cached_summary is not None:
                 print(f"  ✅ Using cached: {article['title'][:50]}...")
-                cached_summary = self.processed_posts[article_hash]
-                summary += cached_summary
+                post_summaries.append(cached_summary)
                 cached_posts_count += 1
             else:
                 print(f"  📝 Analyzing: {article['title'][:50]}...")
-                content_data = self.analyze_content(article['url'])
+                pending.append((len(post_summaries), article_hash, article))
+                post_summaries.append(None)
+        
+        # Fetch new posts concurrently; get() keeps requests to the same host polite
+        if pending:
+            article_urls = [article['url'] for _, _, article in pending]
+            if article_executor is not None:
+                contents = list(article_executor.map(self.analyze_content, article_urls))
+            else:
+                contents = [self.analyze_content(url) for url in article_urls]
+            for (position, article_hash, article), content_data in zip(pending, contents):
                 post_summary = self.generate_post_summary(article['title'], article['url'], content_data)
-                summary += post_summary
+                post_summaries[position] = post_summary
                 
                 # Cache the summary
-                self.processed_posts[article_hash] = post_summary
+                with self.cache_lock:
+                    self.processed_posts[article_hash] = post_summary
                 new_posts_count += 1
-                
-                # Be respectful with requests
-                time.sleep(0.5)
+        
+        parts.extend(post_summaries)
         
         if new_posts_count > 0:
             print(f"  💾 Cached {new_posts_count} new summaries, reused {cached_posts_count} cached summaries")
         
-        return summary
+        return ''.join(parts)
 
 def main():
     analyzer = NewsletterAnalyzer()
@@ -614,32 +774,33 @@ def main():
     
     print(f"📰 Found {len(urls)} sources to analyze...")
     
-    # Analyze each newsletter/blog
+    # Analyze newsletters/blogs concurrently; per-host limits in get() keep this polite.
+    # Article fetches from every newsletter share one pool instead of a new pool per site.
     summaries = []
     total_posts = 0
-    for i, url in enumerate(urls, 1):
-        print(f"📖 Analyzing {i}/{len(urls)}: {url}")
-        
-        newsletter_data = analyzer.fetch_recent_posts(url)
-        summary = analyzer.generate_newsletter_summary(newsletter_data)
-        summaries.append(summary)
-        
-        if newsletter_data['success']:
-            total_posts += len(newsletter_data['articles'])
-        
-        # Be respectful with requests
-        time.sleep(1)
+    with ThreadPoolExecutor(max_workers=12) as executor, ThreadPoolExecutor(max_workers=8) as article_executor:
+        newsletters = list(executor.map(analyzer.fetch_recent_posts, urls))
+        results = executor.map(
+            lambda newsletter_data: analyzer.generate_newsletter_summary(newsletter_data, article_executor),
+            newsletters,
+        )
+        for i, (url, newsletter_data, summary) in enumerate(zip(urls, newsletters, results), 1):
+            print(f"📖 Analyzed {i}/{len(urls)}: {url}")
+            summaries.append(summary)
+            
+            if newsletter_data['success']:
+                total_posts += len(newsletter_data['articles'])
     
     # Generate final report
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    report = f"# Reading List Analysis\n\n"
-    report += f"*Generated on {timestamp}*\n\n"
-    report += f"Individual post summaries from {len(urls)} newsletters and blogs in your reading list.\n\n"
-    report += f"**Total posts analyzed: {total_posts}**\n\n"
-    report += "---\n\n"
-    
-    for summary in summaries:
-        report += summary
+    header = (
+        f"# Reading List Analysis\n\n"
+        f"*Generated on {timestamp}*\n\n"
+        f"Individual post summaries from {len(urls)} newsletters and blogs in your reading list.\n\n"
+        f"**Total posts analyzed: {total_posts}**\n\n"
+        "---\n\n"
+    )
+    report = ''.join([header] + summaries)
     
     # Save the report
     output_path = os.path.join(output_dir, f"update_{datetime.now().strftime('%Y%m%d')}.md")
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import orjson
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(BASE_DIR))
 
@@ -16,8 +19,10 @@ from pipeline.content_index import ContentIndex, ContentRecord
 from pipeline.youtube_ingestor import YouTubeIngestor
 from youtube_transcript import extract_video_id
 TRANSCRIPT_METADATA_PATH = BASE_DIR / "transcript_metadata.json"
+_MIN_DATETIME = datetime.min.replace(tzinfo=timezone.utc)
 
 
+@lru_cache(maxsize=4096)
 def parse_date(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
@@ -31,29 +36,45 @@ def load_transcript_metadata() -> Dict[str, Dict[str, object]]:
     if not TRANSCRIPT_METADATA_PATH.exists():
         return {}
     try:
-        return json.loads(TRANSCRIPT_METADATA_PATH.read_text(encoding="utf-8"))
+        return orjson.loads(TRANSCRIPT_METADATA_PATH.read_bytes())
     except Exception:
         return {}
 
 
+def _unlink_if_exists(path: Path) -> None:
+    path.unlink(missing_ok=True)
+
+
 def choose_best_record(records: List[ContentRecord]) -> ContentRecord:
     def score(record: ContentRecord) -> Tuple[int, datetime, str]:
         published = parse_date(record.published_at)
         has_date = 1 if published else 0
-        return (has_date, published or datetime.min.replace(tzinfo=timezone.utc), record.last_updated)
+        return (has_date, published or _MIN_DATETIME, record.last_updated)
 
-    return sorted(records, key=score, reverse=True)[0]
+    # max() keeps the first of equally scored records, matching a stable reverse sort
+    return max(records, key=score)
 
 
 def dedupe_records(records: Dict[str, ContentRecord]) -> Tuple[Dict[str, ContentRecord], List[str]]:
-    by_url: Dict[str, List[ContentRecord]] = {}
+    # One pass that only builds lists for URLs seen more than once; most URLs are unique.
+    first_by_url: Dict[str, ContentRecord] = {}
+    duplicates: Dict[str, List[ContentRecord]] = {}
     for record in records.values():
-        by_url.setdefault(record.original_url, []).append(record)
+        first = first_by_url.setdefault(record.original_url, record)
+        if first is not record:
+            grouped = duplicates.get(record.original_url)
+            if grouped is None:
+                grouped = duplicates[record.original_url] = [first]
+            grouped.append(record)
 
     cleaned: Dict[str, ContentRecord] = dict(records)
     removed: List[str] = []
-    for url, grouped in by_url.items():
-        if len(grouped) <= 1:
+    if not duplicates:
+        return cleaned, removed
+    # Walk groups in first-seen URL order so removals come out in the same order as before
+    for url in first_by_url:
+        grouped = duplicates.get(url)
+        if grouped is None:
             continue
         keep = choose_best_record(grouped)
         for record in grouped:
@@ -71,21 +92,25 @@ def main() -> None:
     transcript_metadata = load_transcript_metadata()
 
     records = {record.content_id: record for record in index.all()}
+    channel_videos = [
+        record
+        for record in records.values()
+        if record.source_type == "youtube_video" and record.origin == "youtube_channel"
+    ]
+    # Read each channel video's raw cache once, in parallel, and share it between both passes
+    with ThreadPoolExecutor(max_workers=8, thread_name_prefix="cleanup-raw") as pool:
+        raws = list(pool.map(lambda record: cache.load_raw("youtube", record.content_id) or {}, channel_videos))
+
     channel_name_map: Dict[str, str] = {}
-    for record in records.values():
-        if record.source_type != "youtube_video" or record.origin != "youtube_channel":
-            continue
-        raw = cache.load_raw("youtube", record.content_id) or {}
+    for raw in raws:
         channel_id = raw.get("channel_id")
         channel_name = raw.get("channel_name")
         if channel_id and channel_name:
             channel_name_map.setdefault(channel_id, channel_name)
 
     updated = 0
-    for record in list(records.values()):
-        if record.source_type != "youtube_video" or record.origin != "youtube_channel":
-            continue
-        raw = cache.load_raw("youtube", record.content_id) or {}
+    prepared: List[Tuple[ContentRecord, Dict[str, object], Optional[str], Optional[str]]] = []
+    for record, raw in zip(channel_videos, raws):
         video_id = extract_video_id(record.original_url) or raw.get("video_id") or record.content_id
         channel_id = raw.get("channel_id")
 
@@ -101,8 +126,21 @@ def main() -> None:
         if not record.published_at:
             record.published_at = raw.get("published_at") or record.published_at
 
+        prepared.append((record, raw, video_id, channel_id))
+
+    # Only records still missing fields hit the network; fetch those concurrently
+    needs_metadata = list(dict.fromkeys(
+        video_id
+        for record, _, video_id, _ in prepared
+        if (not record.published_at or not record.author) and video_id
+    ))
+    workers = min(ingestor.max_workers, len(needs_metadata)) or 1
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cleanup-meta") as pool:
+        fetched = dict(zip(needs_metadata, pool.map(ingestor._fetch_single_video_metadata, needs_metadata)))
+
+    for record, raw, video_id, channel_id in prepared:
         if (not record.published_at or not record.author) and video_id:
-            metadata = ingestor._fetch_single_video_metadata(video_id)
+            metadata = fetched.get(video_id)
             if metadata:
                 record.published_at = record.published_at or metadata.get("published_at")
                 record.author = record.author or metadata.get("channel_name")
@@ -122,13 +160,11 @@ def main() -> None:
     index._records = cleaned  # intentional: maintenance pass
     index.save()
 
-    for content_id in removed:
-        raw_path = cache.raw_path("youtube", content_id)
-        summary_path = SUMMARY_CACHE_DIR / f"{content_id}.json"
-        if raw_path.exists():
-            raw_path.unlink()
-        if summary_path.exists():
-            summary_path.unlink()
+    stale_paths = [cache.raw_path("youtube", content_id) for content_id in removed]
+    stale_paths += [SUMMARY_CACHE_DIR / f"{content_id}.json" for content_id in removed]
+    if stale_paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale_paths)), thread_name_prefix="cleanup-unlink") as pool:
+            list(pool.map(_unlink_if_exists, stale_paths))
 
     print(f"Updated {updated} channel video records.")
     print(f"Removed {len(removed)} duplicate records.")
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, BinaryIO, Dict, Iterable, Mapping, Optional, Tuple
 
+import orjson
 import yaml
 
 from cache_manager import CacheManager
@@ -19,6 +21,51 @@ except ImportError:  # pragma: no cover - surface clear error at runtime
 
 
 USAGE_LOG = DATA_DIR / "openai_usage.jsonl"
+PROMPT_OVERRIDES_PATH = DATA_DIR / "prompt_overrides.json"
+USER_TAGS_PATH = DATA_DIR / "user_tags.json"
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=8)
+def _merged_prompts(
+    path: str, prompt_stamp: Tuple[int, int], overrides_stamp: Optional[Tuple[int, int]]
+) -> Mapping[str, Any]:
+    """Parse a prompt file and apply prompt_overrides.json once per version of the two files."""
+    with open(path, "r", encoding="utf-8") as handle:
+        prompts = yaml.safe_load(handle) or {}
+    if overrides_stamp is not None:
+        try:
+            overrides = orjson.loads(PROMPT_OVERRIDES_PATH.read_bytes())
+        except Exception:
+            overrides = None
+        if overrides is not None:
+            prompts = _apply_prompt_overrides(prompts, overrides)
+    # Shared by every Summarizer built while the files are unchanged, so hand out a read-only view
+    return MappingProxyType(prompts)
+
+
+def _apply_prompt_overrides(prompts: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    for key, override in overrides.items():
+        if key not in prompts or not isinstance(override, dict):
+            continue
+        merged = dict(prompts[key])
+        for field in ("system", "user", "prompt_version"):
+            if field in override:
+                merged[field] = override[field]
+        prompts[key] = merged
+    return prompts
+
+
+@lru_cache(maxsize=8)
+def _parse_user_tags(stamp: Tuple[int, int]) -> Any:
+    return orjson.loads(USER_TAGS_PATH.read_bytes())
 
 
 @dataclass
@@ -52,7 +99,9 @@ class Summarizer:
         self.client = OpenAI(api_key=api_key)
         self.prompts = self._load_prompts(self.PROMPT_FILES[prompts_key])
 
-    def summarize(self, record: ContentRecord, *, force: bool = False) -> SummaryResult:
+    def summarize(
+        self, record: ContentRecord, *, force: bool = False, usage_log: BinaryIO | None = None
+    ) -> SummaryResult:
         raw_data = self.cache.load_raw(self._raw_source(record.source_type), record.content_id)
         if not raw_data:
             raise SummarizationError(f"Raw content not found for {record.content_id}")
@@ -102,7 +151,7 @@ class Summarizer:
         self.cache.save_summary(record.content_id, summary_payload)
         summary_path = SUMMARY_CACHE_DIR / f"{record.content_id}.json"
 
-        self._log_usage(record, summary_payload)
+        self._log_usage(record, summary_payload, handle=usage_log)
 
         return SummaryResult(
             content_id=record.content_id,
@@ -113,30 +162,11 @@ class Summarizer:
             summary_path=summary_path,
         )
 
-    def _load_prompts(self, path: Path) -> Dict[str, Any]:
-        if not path.exists():
+    def _load_prompts(self, path: Path) -> Mapping[str, Any]:
+        prompt_stamp = _file_stamp(path)
+        if prompt_stamp is None:
             raise SummarizationError(f"Prompt file not found: {path}")
-        with path.open("r", encoding="utf-8") as handle:
-            prompts = yaml.safe_load(handle)
-        return self._apply_prompt_overrides(prompts or {})
-
-    def _apply_prompt_overrides(self, prompts: Dict[str, Any]) -> Dict[str, Any]:
-        overrides_path = DATA_DIR / "prompt_overrides.json"
-        if not overrides_path.exists():
-            return prompts
-        try:
-            overrides = json.loads(overrides_path.read_text(encoding="utf-8"))
-        except Exception:
-            return prompts
-        for key, override in overrides.items():
-            if key not in prompts or not isinstance(override, dict):
-                continue
-            merged = dict(prompts[key])
-            for field in ("system", "user", "prompt_version"):
-                if field in override:
-                    merged[field] = override[field]
-            prompts[key] = merged
-        return prompts
+        return _merged_prompts(str(path), prompt_stamp, _file_stamp(PROMPT_OVERRIDES_PATH))
 
     def _prompt_key(self, source_type: str) -> str:
         if source_type == "youtube_video":
@@ -173,10 +203,11 @@ class Summarizer:
 
     def _merge_tags(self, content_id: str, base_tags: list[str]) -> str:
         user_tags = []
-        user_tags_path = DATA_DIR / "user_tags.json"
-        if user_tags_path.exists():
+        user_tags_stamp = _file_stamp(USER_TAGS_PATH)
+        if user_tags_stamp is not None:
             try:
-                raw = json.loads(user_tags_path.read_text(encoding="utf-8"))
+                # Parsed once per file version rather than once per summarized record
+                raw = _parse_user_tags(user_tags_stamp)
                 if isinstance(raw.get(content_id), list):
                     user_tags = [tag for tag in raw.get(content_id) if isinstance(tag, str)]
             except Exception:
@@ -184,7 +215,9 @@ class Summarizer:
         merged = list(dict.fromkeys([*base_tags, *user_tags]))
         return ", ".join(merged) if merged else "None"
 
-    def _log_usage(self, record: ContentRecord, summary_payload: Dict[str, Any]) -> None:
+    def _log_usage(
+        self, record: ContentRecord, summary_payload: Dict[str, Any], *, handle: BinaryIO | None = None
+    ) -> None:
         usage = summary_payload.get("usage")
         log_entry = {
             "content_id": record.content_id,
@@ -194,35 +227,49 @@ class Summarizer:
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "usage": usage,
         }
+        line = orjson.dumps(log_entry) + b"\n"
+        if handle is not None:
+            handle.write(line)
+            return
         USAGE_LOG.parent.mkdir(parents=True, exist_ok=True)
-        with USAGE_LOG.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(log_entry) + "\n")
-
-
-def summarize_all(index: ContentIndex, cache: CacheManager, *, force: bool = False) -> None:
-    summarizer = Summarizer(cache)
-    for record in index.all():
-        try:
-            result = summarizer.summarize(record, force=force)
-            updated_record = ContentRecord(
-                content_id=record.content_id,
-                source_type=record.source_type,
-                origin=record.origin,
-                original_url=record.original_url,
-                title=record.title,
-                summary_path=str(result.summary_path),
-                published_at=record.published_at,
-                author=record.author,
-                categories=record.categories,
-                tags=record.tags,
-                raw_path=record.raw_path,
-                last_updated=datetime.now(timezone.utc).isoformat(),
-            )
-            index.upsert(updated_record)
-        except SummarizationError as exc:  # pragma: no cover - runtime path
-            print(f"⚠️  Skipping {record.content_id}: {exc}")
-        except Exception as exc:  # pragma: no cover - runtime path
-            print(f"⚠️  Error summarizing {record.content_id}: {exc}")
+        with USAGE_LOG.open("ab") as log_file:
+            log_file.write(line)
+
+
+def summarize_all(
+    index: ContentIndex,
+    cache: CacheManager,
+    *,
+    force: bool = False,
+    records: Optional[Iterable[ContentRecord]] = None,
+    summarizer: Optional[Summarizer] = None,
+) -> None:
+    summarizer = summarizer or Summarizer(cache)
+    # One append handle for the whole batch instead of mkdir/open/close per summarized record
+    USAGE_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with USAGE_LOG.open("ab") as usage_log:
+        for record in index.all() if records is None else records:
+            try:
+                result = summarizer.summarize(record, force=force, usage_log=usage_log)
+                updated_record = ContentRecord(
+                    content_id=record.content_id,
+                    source_type=record.source_type,
+                    origin=record.origin,
+                    original_url=record.original_url,
+                    title=record.title,
+                    summary_path=str(result.summary_path),
+                    published_at=record.published_at,
+                    author=record.author,
+                    categories=record.categories,
+                    tags=record.tags,
+                    raw_path=record.raw_path,
+                    last_updated=datetime.now(timezone.utc).isoformat(),
+                )
+                index.upsert(updated_record)
+            except SummarizationError as exc:  # pragma: no cover - runtime path
+                print(f"⚠️  Skipping {record.content_id}: {exc}")
+            except Exception as exc:  # pragma: no cover - runtime path
+                print(f"⚠️  Error summarizing {record.content_id}: {exc}")
     index.save()
 
 
@@ -0,0 +1,102 @@
+from cache_manager import CacheManager
+from pipeline.blog_ingestor import BlogIngestor
+from pipeline.content_index import ContentIndex
+from pipeline.readinglist_parser import ReadingListEntry
+
+
+INDEX_PAGE = """
+<html><body><main>
+  <h2><a href="/posts/first-long-article">A first long article title</a></h2>
+  <h2><a href="/about">About this blog</a></h2>
+  <h2><a href="https://example.com/posts/second">Second article with title</a></h2>
+</main></body></html>
+"""
+
+ARTICLE_PAGE = """
+<html><head><meta name="author" content="Ada"></head><body>
+  <time datetime="2024-03-01T00:00:00Z">March 1</time>
+  <p>{body} paragraph that is comfortably longer than forty characters.</p>
+  <p>short</p>
+</body></html>
+"""
+
+
+class DummyResponse:
+    def __init__(self, text, status_code=200, headers=None):
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class DummySession:
+    def __init__(self, pages, etags=None):
+        self.pages = pages
+        self.etags = etags or {}
+        self.requested = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.requested.append((url, headers))
+        etag = self.etags.get(url)
+        if etag and headers and headers.get("If-None-Match") == etag:
+            return DummyResponse("", status_code=304)
+        return DummyResponse(self.pages[url], headers={"ETag": etag} if etag else None)
+
+
+PAGES = {
+    "https://example.com/": INDEX_PAGE,
+    "https://example.com/posts/first-long-article": ARTICLE_PAGE.format(body="First"),
+    "https://example.com/posts/second": ARTICLE_PAGE.format(body="Second"),
+}
+
+
+def test_ingest_fetches_posts_and_upserts_records(tmp_path):
+    cache = CacheManager(raw_dir=tmp_path / "raw", summary_dir=tmp_path / "summary")
+    ingestor = BlogIngestor(cache, session=DummySession(PAGES))
+    index = ContentIndex(tmp_path / "index.json")
+    entry = ReadingListEntry(source_type="blog", url="https://example.com/", category="Tech")
+
+    collected = ingestor.ingest([entry], index)
+
+    assert [item.url for item in collected] == [
+        "https://example.com/posts/first-long-article",
+        "https://example.com/posts/second",
+    ]
+    assert collected[0].author == "Ada"
+    assert collected[0].published_at == "2024-03-01T00:00:00Z"
+    assert collected[0].text.startswith("First paragraph")
+    assert len(list(index.all())) == 2
+
+
+def test_download_article_reuses_cache_on_not_modified(tmp_path):
+    url = "https://example.com/posts/second"
+    cache = CacheManager(raw_dir=tmp_path / "raw", summary_dir=tmp_path / "summary")
+    session = DummySession(PAGES, etags={url: '"v1"'})
+    ingestor = BlogIngestor(cache, session=session)
+    entry = ReadingListEntry(source_type="blog", url="https://example.com/", category="Tech")
+
+    first = ingestor._download_and_cache(entry, {"title": "Second article with title", "url": url})
+    second = ingestor._download_article(url)
+
+    assert session.requested[-1] == (url, {"If-None-Match": '"v1"'})
+    assert second["text"] == first["text"]
+    assert second["author"] == "Ada"
+
+
+def test_ingest_fetches_cross_posted_articles_once(tmp_path):
+    cache = CacheManager(raw_dir=tmp_path / "raw", summary_dir=tmp_path / "summary")
+    session = DummySession(PAGES)
+    ingestor = BlogIngestor(cache, session=session, host_interval=0)
+    index = ContentIndex(tmp_path / "index.json")
+    entries = [
+        ReadingListEntry(source_type="blog", url="https://example.com/", category="Tech"),
+        ReadingListEntry(source_type="blog", url="https://example.com/", category="Other"),
+    ]
+
+    collected = ingestor.ingest(entries, index)
+
+    article_requests = [url for url, _ in session.requested if "/posts/" in url]
+    assert len(article_requests) == 2
+    assert [item.categories for item in collected] == [["Tech"], ["Tech"]]
@@ -16,3 +16,17 @@ def test_cache_manager_round_trip(tmp_path):
 
     summary = cache.load_summary("item1")
     assert summary["summary"] == "Summary text"
+
+
+def test_cache_manager_bulk_load(tmp_path):
+    cache = CacheManager(raw_dir=tmp_path / "raw", summary_dir=tmp_path / "summaries")
+
+    cache.save_raw("youtube", "vid1", {"content_hash": "h1"})
+    cache.save_raw("youtube", "vid2", {"content_hash": "h2"})
+    cache.save_summary("vid1", {"summary": "One"})
+
+    raw = cache.load_all_raw("youtube")
+    assert set(raw) == {"vid1", "vid2"}
+    assert raw["vid2"]["content_hash"] == "h2"
+    assert cache.load_all_raw("blogs") == {}
+    assert cache.load_all_summaries()["vid1"]["summary"] == "One"
@@ -0,0 +1,77 @@
+from pipeline.content_index import ContentIndex
+
+
+def make_record(content_id, url, published_at=None, last_updated="2024-01-01T00:00:00+00:00"):
+    record = ContentIndex.build_record(
+        content_id=content_id,
+        source_type="blog_article",
+        origin="blog",
+        original_url=url,
+        title=f"Title {content_id}",
+        raw_path=None,
+        summary_path=None,
+        published_at=published_at,
+        author=None,
+        categories=["Blogs"],
+        tags=[],
+    )
+    record.last_updated = last_updated
+    return record
+
+
+def test_content_index_reloads_when_file_changes(tmp_path):
+    path = tmp_path / "index.json"
+    reader = ContentIndex(path)
+    assert list(reader.all()) == []
+
+    writer = ContentIndex(path)
+    writer.upsert(make_record("a", "https://example.com/a"))
+    writer.save()
+
+    reader.reload_if_modified()
+    assert reader.get("a") is not None
+
+    writer.upsert(make_record("b", "https://example.com/b"))
+    writer.save()
+    reader.reload()
+    assert {record.content_id for record in reader.all()} == {"a", "b"}
+
+
+def test_dedupe_by_url_keeps_one_record_per_url(tmp_path):
+    index = ContentIndex(tmp_path / "index.json")
+    index.upsert(make_record("old", "https://example.com/a", published_at="2024-01-01T00:00:00Z"))
+    index.upsert(make_record("new", "https://example.com/a", published_at="2024-02-01T00:00:00Z"))
+    index.upsert(make_record("stale", "https://example.com/b", last_updated="2024-01-01T00:00:00+00:00"))
+    index.upsert(make_record("fresh", "https://example.com/b", last_updated="2024-03-01T00:00:00+00:00"))
+    index.upsert(make_record("solo", "https://example.com/c"))
+
+    index.dedupe_by_url()
+
+    assert [record.content_id for record in index.all()] == ["new", "fresh", "solo"]
+
+
+def test_save_skips_write_when_index_unchanged(tmp_path):
+    path = tmp_path / "index.json"
+    index = ContentIndex(path)
+    index.upsert(make_record("a", "https://example.com/a"))
+    index.save()
+    first_mtime = path.stat().st_mtime_ns
+
+    ContentIndex(path).save()
+
+    assert path.stat().st_mtime_ns == first_mtime
+    assert not (tmp_path / "index.json.tmp").exists()
+
+
+def test_deferred_save_writes_once_on_exit(tmp_path):
+    path = tmp_path / "index.json"
+    index = ContentIndex(path)
+
+    with index.deferred_save():
+        index.upsert(make_record("a", "https://example.com/a"))
+        index.save()
+        assert not path.exists()
+        index.upsert(make_record("b", "https://example.com/b"))
+        index.save()
+
+    assert {record.content_id for record in ContentIndex(path).all()} == {"a", "b"}
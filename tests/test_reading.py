@@ -0,0 +1,34 @@
+from reading import NewsletterAnalyzer
+
+
+READING_LIST = """
+* [[https://example.substack.com/p/first-post][First post]]
+* [Second post](https://example.substack.com/p/second-post)
+* https://example.substack.com/p/first-post
+* https://other.blog/archive
+"""
+
+
+def test_extract_urls_keeps_every_post_on_a_domain_by_default(tmp_path):
+    path = tmp_path / "readinglist.md"
+    path.write_text(READING_LIST, encoding="utf-8")
+
+    urls = NewsletterAnalyzer().extract_urls_from_readinglist(path)
+
+    assert urls == [
+        "https://example.substack.com/p/first-post",
+        "https://example.substack.com/p/second-post",
+        "https://other.blog/archive",
+    ]
+
+
+def test_extract_urls_domain_dedup_is_opt_in(tmp_path):
+    path = tmp_path / "readinglist.md"
+    path.write_text(READING_LIST, encoding="utf-8")
+
+    urls = NewsletterAnalyzer().extract_urls_from_readinglist(path, dedup_by="domain")
+
+    assert urls == [
+        "https://example.substack.com/p/first-post",
+        "https://other.blog/archive",
+    ]
@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 
 import pytest
@@ -97,3 +98,109 @@ def test_fetch_channel_videos_from_page_parses_videos(tmp_path, monkeypatch):
     assert videos[0]["title"] == "Video One"
     assert videos[0]["channel_name"] == "Channel"
 
+
+def test_fetch_channel_videos_reuses_cached_feed(tmp_path, monkeypatch):
+    ingestor = build_ingestor(tmp_path)
+    calls = []
+
+    def fake_download(channel_id, limit):
+        calls.append(channel_id)
+        return [{"video_id": "vid1", "title": "Video One", "url": "https://www.youtube.com/watch?v=vid1"}]
+
+    monkeypatch.setattr(ingestor, "_download_channel_videos", fake_download)
+
+    first = ingestor._fetch_channel_videos("UC1234567890", limit=5)
+    first[0]["order_index"] = 3
+    second = ingestor._fetch_channel_videos("UC1234567890", limit=5)
+
+    assert calls == ["UC1234567890"]
+    assert "order_index" not in second[0]
+
+
+def test_fetch_channel_videos_parses_rss_feed(tmp_path, monkeypatch):
+    ingestor = build_ingestor(tmp_path)
+    entries = "".join(
+        f"<entry><yt:videoId>vid{i}</yt:videoId><title>Video {i}</title>"
+        f"<published>2024-01-0{i + 1}T00:00:00+00:00</published><author><name>Channel</name></author></entry>"
+        for i in range(3)
+    )
+    feed = (
+        '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns="http://www.w3.org/2005/Atom">'
+        f"{entries}</feed>"
+    ).encode("utf-8")
+
+    def fake_get(url, timeout):
+        return SimpleNamespace(content=feed, raise_for_status=lambda: None)
+
+    monkeypatch.setattr(ingestor.session, "get", fake_get)
+
+    videos = ingestor._fetch_channel_videos("UC1234567890", limit=2)
+
+    assert [video["video_id"] for video in videos] == ["vid0", "vid1"]
+    assert videos[0]["channel_name"] == "Channel"
+    assert videos[0]["published_at"] == "2024-01-01T00:00:00+00:00"
+
+
+def test_ingest_skips_rehashing_unchanged_transcripts(tmp_path, monkeypatch):
+    from pipeline.content_index import ContentIndex
+    from pipeline.readinglist_parser import ReadingListEntry
+
+    ingestor = build_ingestor(tmp_path)
+    transcript = tmp_path / "abcdefghijk.txt"
+    transcript.write_text("hello transcript", encoding="utf-8")
+    video = {
+        "video_id": "abcdefghijk",
+        "title": "Video",
+        "published_at": "2024-01-01T00:00:00Z",
+        "url": "https://www.youtube.com/watch?v=abcdefghijk",
+        "transcript_file": str(transcript),
+    }
+    monkeypatch.setattr(ingestor, "_collect_videos", lambda entry: [dict(video)])
+    hashed = []
+    original_sha256 = ingestor.cache.sha256
+    monkeypatch.setattr(ingestor.cache, "sha256", lambda text: hashed.append(text) or original_sha256(text))
+    loads = []
+    original_load = ingestor._load_transcript
+    monkeypatch.setattr(ingestor, "_load_transcript", lambda video: loads.append(video) or original_load(video))
+    entry = ReadingListEntry(source_type="youtube_video", url=video["url"], category="Videos")
+    index = ContentIndex(tmp_path / "index.json")
+
+    ingestor.ingest([entry], index)
+    collected = ingestor.ingest([entry], index)
+
+    assert hashed == ["hello transcript"]
+    assert len(loads) == 1
+    assert collected[0].transcript == "hello transcript"
+    raw = ingestor.cache.load_raw("youtube", "abcdefghijk")
+    assert raw["content_hash"] == original_sha256("hello transcript")
+
+
+def test_collect_videos_hydrates_missing_dates_in_order(tmp_path, monkeypatch):
+    from pipeline.readinglist_parser import ReadingListEntry
+
+    ingestor = build_ingestor(tmp_path)
+    remote = [
+        {"video_id": f"vid{i}", "title": f"Video {i}", "published_at": None, "order_index": i}
+        for i in range(3)
+    ]
+    monkeypatch.setattr(ingestor, "_videos_from_store", lambda entry, channel_id: [])
+    monkeypatch.setattr(ingestor, "_fetch_channel_videos", lambda channel_id, limit: [dict(v) for v in remote])
+    monkeypatch.setattr(
+        ingestor,
+        "_fetch_single_video_metadata",
+        lambda video_id: {"published_at": f"2024-01-0{int(video_id[-1]) + 1}T00:00:00Z", "channel_name": "Channel"},
+    )
+    entry = ReadingListEntry(
+        source_type="youtube_channel", url="https://www.youtube.com/channel/UC1234567890", category="Videos"
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as metadata_pool:
+        ingestor._metadata_pool = metadata_pool
+        videos = ingestor._collect_videos(entry)
+
+    assert {video["video_id"]: video["published_at"] for video in videos} == {
+        "vid0": "2024-01-01T00:00:00Z",
+        "vid1": "2024-01-02T00:00:00Z",
+        "vid2": "2024-01-03T00:00:00Z",
+    }
+    assert all(video["channel_name"] == "Channel" for video in videos)